@@ -2,12 +2,17 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from cache import ResultCache
 from resume_parser import ResumeParser
-import tempfile
-import os
 import base64
-parser = ResumeParser()
-# Page configuration
+
+@st.cache_resource
+def get_parser():
+    # One parser per server process, so re-uploads hit the in-memory cache too
+    return ResumeParser(cache=ResultCache())
+
+# Page configuration; must be the first Streamlit call, so get_parser (whose
+# cache spinner draws an element) only runs later, inside main()
 st.set_page_config(
     page_title="AI Resume Parser",
     page_icon="📄",
@@ -48,6 +53,8 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def main():
+    parser = get_parser()
+    
     # Header
     st.markdown('<h1 class="main-header">🤖 AI Resume Parser</h1>', unsafe_allow_html=True)
     
@@ -60,7 +67,7 @@ def main():
     
     st.sidebar.title("Instructions")
     st.sidebar.write("""
-    1. Upload a resume file (PDF or DOCX)
+    1. Upload a resume file (PDF, DOCX, TXT, RTF, ODT, HTML or Markdown)
     2. The parser will automatically extract information
     3. View results in organized sections
     4. Download the parsed data if needed
@@ -68,24 +75,16 @@ def main():
     
     # File upload
     uploaded_file = st.file_uploader(
-        "📤 Upload Resume (PDF or DOCX)", 
-        type=['pdf', 'docx'],
-        help="Supported formats: PDF, DOCX"
+        "📤 Upload Resume (PDF, DOCX, TXT, RTF, ODT, HTML or Markdown)", 
+        type=['pdf', 'docx', 'txt', 'rtf', 'odt', 'html', 'htm', 'md'],
+        help="Supported formats: PDF, DOCX, TXT, RTF, ODT, HTML, Markdown"
     )
     
     if uploaded_file is not None:
-        # Save uploaded file to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
-        
-        # Initialize parser
-                # Parse resume
+        # Parse the upload as a named stream: no temporary file, and the name
+        # tells Markdown and HTML fragments apart from plain text
         with st.spinner('🔍 Analyzing resume... This may take a few seconds.'):
-            result = parser.parse_resume(tmp_file_path)
-        
-        # Clean up temporary file
-        os.unlink(tmp_file_path)
+            result = parser.parse_resume(uploaded_file)
         
         if not result.get('success', False):
             st.error(f"❌ {result.get('error', 'Unknown error occurred')}")
@@ -213,6 +212,12 @@ def main():
                     mime="text/plain"
                 )
         
+        # Cache statistics
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("Result Cache")
+        stats = parser.cache.stats
+        st.sidebar.write(f"Hits: {stats['memory_hits'] + stats['disk_hits']} · Misses: {stats['misses']}")
+        
         # Batch processing section
         st.sidebar.markdown("---")
         st.sidebar.subheader("Batch Processing")
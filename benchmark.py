@@ -0,0 +1,517 @@
+"""Micro-benchmarks for the resume parser's hot paths.
+
+Run `python benchmark.py <name>`; each benchmark prints a small table.
+"""
+import argparse
+import collections
+import difflib
+import random
+import re
+import string
+import sys
+import time
+
+SAMPLE_RESUME = """John Smith
+Senior Software Engineer | john.smith@example.com | +1 (555) 123-4567 | linkedin.com/in/johnsmith
+
+Summary
+Backend engineer with 8 years of experience building distributed systems in Python, Go and C++.
+Comfortable with Docker, Kubernetes, Terraform and CI/CD pipelines on AWS and GCP.
+
+Experience
+Acme Corp, Senior Software Engineer, Jan 2019 - Present
+Built Node.js and Django services backed by PostgreSQL and Redis. Led the migration to Kubernetes.
+Globex Inc, Software Engineer, Jun 2015 - Dec 2018
+Machine learning pipelines with pandas, numpy and scikit-learn; dashboards in React.
+
+Education
+Bachelor of Science in Computer Science, State University, 2015
+
+Skills
+Python, Java, C#, Git, Jira, Linux, Bash, MySQL, MongoDB
+"""
+
+
+def _timeit(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _print_table(headers, rows):
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+
+def _synthetic_taxonomy(size, seed=0):
+    """The parser's real skills padded with random made-up ones up to `size`"""
+    from resume_parser import ResumeParser
+
+    base = ResumeParser().skills_db
+    taxonomy = {category: list(skills) for category, skills in base.items()}
+    categories = list(taxonomy)
+    total = sum(len(skills) for skills in taxonomy.values())
+    rng = random.Random(seed)
+    while total < size:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        if rng.random() < 0.2:
+            word += ' ' + ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        taxonomy[rng.choice(categories)].append(word)
+        total += 1
+    return taxonomy
+
+
+def _regex_per_skill(skills_db, text):
+    # The original extract_skills: one regex search per skill
+    text_lower = text.lower()
+    skills_found = {}
+    for category, skills in skills_db.items():
+        category_skills = [skill for skill in skills
+                           if re.search(r'\b' + re.escape(skill) + r'\b', text_lower)]
+        if category_skills:
+            skills_found[category] = category_skills
+    return skills_found
+
+
+def bench_skills(args):
+    """Skill matching: compiled automaton versus one regex per skill"""
+    from skill_matcher import SkillMatcher
+
+    text = SAMPLE_RESUME * args.copies
+    rows = []
+    for size in args.sizes:
+        taxonomy = _synthetic_taxonomy(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build = time.perf_counter() - start
+        matched = _timeit(lambda: matcher.match(text))
+        if size <= args.max_baseline:
+            baseline = _timeit(lambda: _regex_per_skill(taxonomy, text), repeat=1)
+            baseline_ms, speedup = f"{baseline * 1000:.1f}", f"{baseline / matched:.1f}x"
+        else:
+            baseline_ms, speedup = "skipped", "-"
+        rows.append((size, f"{build * 1000:.1f}", f"{matched * 1000:.2f}", baseline_ms, speedup))
+    print(f"text: {len(text)} chars")
+    _print_table(("skills", "build ms", "match ms", "regex ms", "speedup"), rows)
+
+
+def bench_taxonomy(args):
+    """Taxonomy load: compiling the matcher versus reading the cached index"""
+    import json
+    import tempfile
+
+    from taxonomy import SkillTaxonomy
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = f"{tmp}/skills-{size}.json"
+            with open(path, 'w') as f:
+                json.dump({'categories': _synthetic_taxonomy(size)}, f)
+            cache_dir = f"{tmp}/cache-{size}"
+            start = time.perf_counter()
+            SkillTaxonomy(path, cache_dir=cache_dir)
+            cold = time.perf_counter() - start
+            warm = _timeit(lambda: SkillTaxonomy(path, cache_dir=cache_dir), repeat=3)
+            rows.append((size, f"{cold * 1000:.1f}", f"{warm * 1000:.1f}", f"{cold / warm:.1f}x"))
+    _print_table(("skills", "compile ms", "index ms", "speedup"), rows)
+
+
+def _legacy_preprocess(text):
+    # The original preprocess_text: two uncompiled re.sub passes
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s\.@-]', '', text)
+    return text.strip()
+
+
+def bench_normalize(args):
+    """Text normalization: single-pass normalizer versus the legacy two re.sub passes"""
+    import normalizer
+
+    rows = []
+    for size in args.sizes:
+        text = (SAMPLE_RESUME * (size // len(SAMPLE_RESUME) + 1))[:size]
+        legacy = _timeit(lambda: _legacy_preprocess(text))
+        cleaned = _timeit(lambda: normalizer.clean(text))
+        mapped = _timeit(lambda: normalizer.normalize(text))
+        rows.append((size, f"{legacy * 1000:.2f}", f"{cleaned * 1000:.2f}",
+                     f"{mapped * 1000:.2f}", f"{legacy / cleaned:.1f}x"))
+    _print_table(("chars", "legacy ms", "normalize ms", "with offsets ms", "speedup"), rows)
+
+
+def bench_batch(args):
+    """Batch throughput of parse_many for increasing worker counts"""
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    rows = []
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        failed = sum(1 for _, result in parser.parse_many(args.paths, workers=workers,
+                                                           chunksize=args.chunksize)
+                     if not result.get('success'))
+        elapsed = time.perf_counter() - start
+        rate = len(args.paths) / elapsed
+        baseline = baseline or rate
+        rows.append((workers, f"{elapsed:.2f}", f"{rate:.1f}", f"{rate / baseline:.2f}x", failed))
+    _print_table(("workers", "seconds", "docs/s", "scaling", "failed"), rows)
+
+
+def bench_pdf_pages(args):
+    """Per-file PDF extraction latency with pages split across worker processes"""
+    from cli import percentile
+    from resume_parser import ResumeParser
+
+    rows = []
+    baseline = None
+    for workers in args.workers:
+        latencies = []
+        with ResumeParser(pdf_workers=workers) as parser:
+            for path in args.paths:
+                start = time.perf_counter()
+                parser.extract_text_from_pdf(path)
+                latencies.append(time.perf_counter() - start)
+        p50, p99 = percentile(latencies, 50), percentile(latencies, 99)
+        baseline = baseline or p99
+        rows.append((workers, f"{p50 * 1000:.0f}", f"{p99 * 1000:.0f}", f"{baseline / p99:.2f}x"))
+    _print_table(("workers", "p50 ms", "p99 ms", "p99 speedup"), rows)
+
+
+def _text_diff(reference, text):
+    """(word recall, word-sequence similarity) of `text` against a reference extraction"""
+    ref_words, words = reference.split(), text.split()
+    if not ref_words:
+        return 1.0, 1.0
+    remaining = collections.Counter(words)
+    found = 0
+    for word in ref_words:
+        if remaining[word]:
+            remaining[word] -= 1
+            found += 1
+    similarity = difflib.SequenceMatcher(None, ref_words, words, autojunk=False).ratio()
+    return found / len(ref_words), similarity
+
+
+def bench_pdf_profiles(args):
+    """Throughput and text differences of the PDF extraction profiles against 'balanced'
+
+    'balanced' is the default and reorders two-column pages, so it differs
+    from the plain extract_text() output older releases produced; that is
+    the 'legacy' row.
+    """
+    import pdf_extract
+
+    texts = {}
+    rows = []
+    # 'balanced' is the reference the others are compared with, so it always runs
+    for profile in dict.fromkeys([pdf_extract.BALANCED] + args.profiles):
+        pages = 0
+        start = time.perf_counter()
+        for path in args.paths:
+            page_texts = list(pdf_extract.iter_page_texts(path, profile=profile))
+            pages += len(page_texts)
+            texts[profile, path] = pdf_extract.join_pages(page.text for page in page_texts)
+        elapsed = time.perf_counter() - start
+        rows.append([profile, f"{len(args.paths) / elapsed:.1f}", f"{pages / elapsed:.1f}"])
+
+    for row in rows:
+        diffs = [_text_diff(texts[pdf_extract.BALANCED, path], texts[row[0], path]) for path in args.paths]
+        row.append(f"{sum(recall for recall, _ in diffs) / len(diffs):.3f}")
+        row.append(f"{sum(similarity for _, similarity in diffs) / len(diffs):.3f}")
+    _print_table(("profile", "docs/s", "pages/s", "word recall", "order similarity"), rows)
+
+
+def bench_pdf_columns(args):
+    """Cost of column-aware reading order over plain page.extract_text()"""
+    import pdfplumber
+    import pdf_extract
+
+    def plain(page):
+        return page.extract_text()
+
+    def columns(page):
+        return pdf_extract.read_page(page)
+
+    def run(read):
+        for path in args.paths:
+            with pdfplumber.open(path) as pdf:
+                for page in pdf.pages:
+                    read(page)
+                    pdf_extract._release(page)
+
+    two_column = 0
+    for path in args.paths:
+        two_column += sum(1 for page in pdf_extract.iter_page_texts(path)
+                          if page.strategy == pdf_extract.COLUMNS)
+    plain_time = _timeit(lambda: run(plain), args.repeat)
+    columns_time = _timeit(lambda: run(columns), args.repeat)
+    overhead = columns_time / plain_time - 1
+    _print_table(("reader", "seconds", "overhead"), [
+        ("extract_text", f"{plain_time:.3f}", ""),
+        ("read_page (columns)", f"{columns_time:.3f}", f"{overhead:+.1%}"),
+    ])
+    print(f"{two_column} page(s) read as two columns; budget is +{args.budget:.0%}: "
+          f"{'ok' if overhead <= args.budget else 'OVER BUDGET'}")
+    return 1 if overhead > args.budget else 0
+
+
+def _python_docx_text(path):
+    """DOCX text the way extract_text_from_docx read it with python-docx"""
+    from docx import Document
+
+    doc = Document(path)
+    text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text:
+                    text += cell.text + "\n"
+    return text
+
+
+def _peak_bytes(func):
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_docx(args):
+    """Time and peak traced memory per DOCX file, streaming reader against python-docx"""
+    import docx_extract
+
+    readers = [("stream", docx_extract.extract_text)]
+    try:
+        import docx
+        readers.append(("python-docx", _python_docx_text))
+    except ImportError:
+        print("python-docx is not installed; reporting the streaming reader only")
+
+    headers = ["file"]
+    for name, _ in readers:
+        headers += [f"{name} ms", f"{name} peak KB"]
+    rows = []
+    for path in args.paths:
+        row = [path]
+        for _, read in readers:
+            seconds = _timeit(lambda: read(path), args.repeat)
+            row += [f"{seconds * 1000:.1f}", f"{_peak_bytes(lambda: read(path)) / 1024:.0f}"]
+        rows.append(row)
+    _print_table(headers, rows)
+
+
+_LEGACY_EXPERIENCE_PATTERNS = [
+    r'(\d+)\s*years?\s*of?\s*experience',
+    r'experience.*(\d+)\s*years?',
+    r'worked\s*for\s*(\d+)\s*years?',
+    r'(\d+)\+?\s*years?\s*in',
+    r'(\d+)\+?\s*years?\s*professional'
+]
+
+
+def _legacy_years(text):
+    for pattern in _LEGACY_EXPERIENCE_PATTERNS:
+        matches = re.findall(pattern, text.lower())
+        if matches:
+            return matches[0]
+    return None
+
+
+def bench_experience(args):
+    """Years-of-experience scanning on adversarial input (ReDoS stress)"""
+    from experience import find_years
+
+    # Flattened one-line text full of "experience" and digits but no "N years":
+    # the old greedy pattern rescans to the end of the text from every occurrence
+    unit = "experience with 3 teams across 12 projects and 2 products; "
+    rows = []
+    failed = False
+    for size in args.sizes:
+        text = (unit * (size // len(unit) + 1))[:size]
+        scanner = _timeit(lambda: find_years(text), repeat=3)
+        if size <= args.max_baseline:
+            legacy = f"{_timeit(lambda: _legacy_years(text), repeat=1) * 1000:.1f}"
+        else:
+            legacy = "skipped"
+        ok = scanner <= args.budget * size / 1_000_000
+        failed = failed or not ok
+        rows.append((size, legacy, f"{scanner * 1000:.1f}", "ok" if ok else "OVER BUDGET"))
+    _print_table(("chars", "legacy ms", "scanner ms", f"<= {args.budget}s/MB"), rows)
+    return 1 if failed else 0
+
+
+def _synthetic_resumes(count, jobs, seed=0):
+    rng = random.Random(seed)
+    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    resumes = []
+    for _ in range(count):
+        lines = [SAMPLE_RESUME.split("Experience")[0], "Experience"]
+        year = rng.randint(1995, 2015)
+        for job in range(jobs):
+            start, year = year, year + rng.randint(1, 4)
+            end = "Present" if job == jobs - 1 else f"{rng.choice(months)} {year}"
+            lines.append(f"Company {job}, Engineer, {rng.choice(months)} {start} - {end}")
+            lines.append("Built and operated services, worked with the team on delivery. " * 3)
+        resumes.append("\n".join(lines))
+    return resumes
+
+
+def bench_timeline(args):
+    """Date-range timeline throughput over synthetic resumes"""
+    from timeline import build_timeline
+
+    rows = []
+    failed = False
+    for jobs in args.jobs:
+        resumes = _synthetic_resumes(args.count, jobs)
+        seconds = _timeit(lambda: [build_timeline(text) for text in resumes], repeat=3)
+        rate = len(resumes) / seconds
+        ok = rate >= args.min_rate
+        failed = failed or not ok
+        rows.append((jobs, f"{rate:,.0f}", f"{seconds / len(resumes) * 1e6:.0f}", "ok" if ok else "TOO SLOW"))
+    _print_table(("jobs", "docs/s", "us/doc", f">= {args.min_rate:,} docs/s"), rows)
+    return 1 if failed else 0
+
+
+def bench_names(args):
+    """How often the header-line name heuristic settles the name without NER"""
+    import names
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    fast = agree = 0
+    header_seconds = ner_seconds = 0.0
+    for path in args.paths:
+        raw = parser.extract_text(path)
+        context = parser.analyze(parser.preprocess_text(raw), raw_text=raw)
+        start = time.perf_counter()
+        name, confidence = names.header_name(raw)
+        header_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        ner_name = parser.extract_name_ner(context)
+        ner_seconds += time.perf_counter() - start
+        if confidence >= names.CONFIDENT:
+            fast += 1
+            agree += name.lower() == ner_name.lower()
+    docs = len(args.paths)
+    _print_table(("docs", "fast path", "agrees with NER", "heuristic us/doc", "NER ms/doc"), [(
+        docs, f"{fast / docs:.1%}", f"{agree / fast:.1%}" if fast else "-",
+        f"{header_seconds / docs * 1e6:.0f}", f"{ner_seconds / docs * 1000:.1f}",
+    )])
+
+
+def bench_fields(args):
+    """parse_resume time per field selection, against parsing every field"""
+    from resume_parser import ResumeParser, required_stages
+
+    parser = ResumeParser()
+    # Load the model up front so the first selection doesn't pay for it
+    parser.nlp
+    rows = []
+    baseline = None
+    for selection in ['all'] + args.fields:
+        fields = None if selection == 'all' else selection.split(',')
+
+        def run():
+            for path in args.paths:
+                parser.parse_resume(path, fields=fields)
+
+        seconds = _timeit(run, args.repeat) / len(args.paths)
+        baseline = baseline or seconds
+        rows.append((selection, ','.join(required_stages(fields)), f"{seconds * 1000:.1f}",
+                     f"{baseline / seconds:.2f}x"))
+    _print_table(("fields", "stages", "ms/doc", "speedup"), rows)
+
+
+BENCHMARKS = {
+    'skills': bench_skills,
+    'taxonomy': bench_taxonomy,
+    'normalize': bench_normalize,
+    'batch': bench_batch,
+    'pdf-pages': bench_pdf_pages,
+    'pdf-profiles': bench_pdf_profiles,
+    'pdf-columns': bench_pdf_columns,
+    'docx': bench_docx,
+    'experience': bench_experience,
+    'timeline': bench_timeline,
+    'names': bench_names,
+    'fields': bench_fields,
+}
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Resume parser micro-benchmarks")
+    subparsers = arg_parser.add_subparsers(dest='benchmark', required=True)
+
+    skills = subparsers.add_parser('skills', help=bench_skills.__doc__)
+    skills.add_argument('--sizes', type=int, nargs='+', default=[50, 500, 5000, 50000])
+    skills.add_argument('--copies', type=int, default=1, help="repeat the sample resume this many times")
+    skills.add_argument('--max-baseline', type=int, default=5000,
+                        help="skip the per-skill regex baseline above this many skills")
+
+    taxonomy = subparsers.add_parser('taxonomy', help=bench_taxonomy.__doc__)
+    taxonomy.add_argument('--sizes', type=int, nargs='+', default=[500, 5000, 50000])
+
+    normalize = subparsers.add_parser('normalize', help=bench_normalize.__doc__)
+    normalize.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+
+    batch = subparsers.add_parser('batch', help=bench_batch.__doc__)
+    batch.add_argument('paths', nargs='+', help="resume files to parse")
+    batch.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    batch.add_argument('--chunksize', type=int, default=1)
+
+    pdf_pages = subparsers.add_parser('pdf-pages', help=bench_pdf_pages.__doc__)
+    pdf_pages.add_argument('paths', nargs='+', help="PDF files, ideally 20+ pages long")
+    pdf_pages.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+
+    pdf_profiles = subparsers.add_parser('pdf-profiles', help=bench_pdf_profiles.__doc__)
+    pdf_profiles.add_argument('paths', nargs='+', help="reference corpus of PDF resumes")
+    pdf_profiles.add_argument('--profiles', nargs='+', default=['fast', 'balanced', 'accurate', 'legacy'],
+                              choices=['fast', 'balanced', 'accurate', 'legacy'])
+
+    pdf_columns = subparsers.add_parser('pdf-columns', help=bench_pdf_columns.__doc__)
+    pdf_columns.add_argument('paths', nargs='+', help="PDF resumes, single- and two-column")
+    pdf_columns.add_argument('--repeat', type=int, default=3)
+    pdf_columns.add_argument('--budget', type=float, default=0.2, help="allowed overhead, as a fraction")
+
+    docx = subparsers.add_parser('docx', help=bench_docx.__doc__)
+    docx.add_argument('paths', nargs='+', help="DOCX resumes")
+    docx.add_argument('--repeat', type=int, default=3)
+
+    experience = subparsers.add_parser('experience', help=bench_experience.__doc__)
+    experience.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    experience.add_argument('--max-baseline', type=int, default=20_000,
+                            help="skip the legacy patterns above this many characters (they are quadratic)")
+    experience.add_argument('--budget', type=float, default=0.5, help="allowed scanner seconds per MB")
+
+    timeline = subparsers.add_parser('timeline', help=bench_timeline.__doc__)
+    timeline.add_argument('--jobs', type=int, nargs='+', default=[2, 5, 10], help="roles per resume")
+    timeline.add_argument('--count', type=int, default=1000, help="resumes per run")
+    timeline.add_argument('--min-rate', type=int, default=1000, help="required docs/s")
+
+    names = subparsers.add_parser('names', help=bench_names.__doc__)
+    names.add_argument('paths', nargs='+', help="resume corpus")
+
+    fields = subparsers.add_parser('fields', help=bench_fields.__doc__)
+    fields.add_argument('paths', nargs='+', help="resume files to parse")
+    fields.add_argument('--fields', nargs='+', default=['contact_info,skills', 'name', 'education',
+                                                         'experience', 'name,contact_info,skills'],
+                        help="comma-separated field selections to compare with all fields")
+    fields.add_argument('--repeat', type=int, default=3)
+
+    args = arg_parser.parse_args(argv)
+    return BENCHMARKS[args.benchmark](args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
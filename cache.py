@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from taxonomy import default_cache_dir
+
+
+def content_hash(data):
+    """SHA-256 hex digest of a file's bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def result_key(digest, parser_version, taxonomy_version):
+    """Cache key for a parse result: the file content plus everything that shapes the output"""
+    return f"{digest}:{parser_version}:{taxonomy_version}"
+
+
+def text_key(digest, extractor_version):
+    """Cache key for extracted text: the file content plus the extraction code version"""
+    return f"{digest}:{extractor_version}"
+
+
+class SqliteCache:
+    """Two-tier cache: an in-memory LRU over a zlib-compressed SQLite table.
+
+    The disk tier evicts least-recently-used rows once it grows past
+    `max_disk_bytes`. Hits and misses are counted on the cache and, if
+    given, on a metrics sink. Subclasses define how values are encoded.
+    """
+
+    filename = "cache.sqlite"
+    metric_name = "cache"
+
+    def __init__(self, path=None, max_memory_items=256, max_disk_bytes=256 * 2**20, metrics=None):
+        if path is None:
+            path = os.path.join(default_cache_dir(), self.filename)
+        self.path = path
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.metrics = metrics
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._disk_bytes = 0
+
+    def _connection(self):
+        # Connections don't survive fork, so pool workers open their own
+        if self._conn is None or self._pid != os.getpid():
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._disk_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _count(self, outcome):
+        self.stats[outcome] += 1
+        if self.metrics is not None:
+            self.metrics.count(self.metric_name, outcome=outcome)
+
+    def get(self, key):
+        """The cached value for `key`, or None"""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._count('memory_hits')
+                return self._decode(value)
+
+            try:
+                conn = self._connection()
+                row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+                    conn.commit()
+            except sqlite3.Error as e:
+                print(f"{type(self).__name__} read error: {e}")
+                row = None
+            if row is None:
+                self._count('misses')
+                return None
+            value = zlib.decompress(row[0]).decode('utf-8')
+            self._remember(key, value)
+            self._count('disk_hits')
+            return self._decode(value)
+
+    def _encode(self, value):
+        return value
+
+    def _decode(self, value):
+        return value
+
+    def put(self, key, value):
+        value = self._encode(value)
+        with self._lock:
+            self._remember(key, value)
+            blob = zlib.compress(value.encode('utf-8'))
+            try:
+                conn = self._connection()
+                old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                conn.execute("INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                             (key, blob, len(blob), time.time()))
+                self._disk_bytes += len(blob) - (old[0] if old else 0)
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"{type(self).__name__} write error: {e}")
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict(self, conn):
+        # Drop least-recently-used rows until back under 90% of the budget,
+        # so eviction doesn't run again on the very next insert
+        target = self.max_disk_bytes * 0.9
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed")
+        doomed = []
+        for key, size in rows:
+            if self._disk_bytes <= target:
+                break
+            doomed.append((key,))
+            self._disk_bytes -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+            self._disk_bytes = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class ResultCache(SqliteCache):
+    """Cache of parse results keyed by result_key().
+
+    Values are stored as JSON, so every hit returns a fresh copy that the
+    caller is free to modify.
+    """
+
+    filename = "results.sqlite"
+    metric_name = "result_cache"
+
+    def _encode(self, value):
+        return json.dumps(value, ensure_ascii=False)
+
+    def _decode(self, value):
+        return json.loads(value)
+
+
+class TextCache(SqliteCache):
+    """Cache of raw extracted text keyed by text_key().
+
+    Kept apart from results so a taxonomy or extractor change can re-run
+    analysis over a corpus without decoding any PDF or DOCX again. Texts
+    are large, so fewer of them are held in memory.
+    """
+
+    filename = "texts.sqlite"
+    metric_name = "text_cache"
+
+    def __init__(self, path=None, max_memory_items=32, max_disk_bytes=1024 * 2**20, metrics=None):
+        super().__init__(path, max_memory_items, max_disk_bytes, metrics)
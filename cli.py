@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+from formats import SUFFIXES
+from result_fields import RESULT_FIELDS, check_fields
+
+SUPPORTED_SUFFIXES = tuple(SUFFIXES)
+
+
+def _is_supported(name):
+    return name.lower().endswith(SUPPORTED_SUFFIXES)
+
+
+@contextlib.contextmanager
+def collect_inputs(source):
+    """Yield a list of (id, path) pairs for a directory, glob pattern or zip archive.
+
+    Zip members are extracted to a temporary directory that is removed on
+    exit; their id is "<archive>:<member>" so a resumed run recognises them.
+    """
+    if os.path.isdir(source):
+        paths = []
+        for root, _, files in os.walk(source):
+            paths.extend(os.path.join(root, name) for name in files if _is_supported(name))
+        yield [(path, path) for path in sorted(paths)]
+    elif not _is_supported(source) and zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive, tempfile.TemporaryDirectory() as tmp_dir:
+            inputs = []
+            for index, member in enumerate(archive.infolist()):
+                if member.is_dir() or not _is_supported(member.filename):
+                    continue
+                # Flatten member names so nothing can be written outside tmp_dir
+                target = os.path.join(tmp_dir, f"{index}-{os.path.basename(member.filename)}")
+                with archive.open(member) as src, open(target, 'wb') as dst:
+                    dst.write(src.read())
+                inputs.append((f"{source}:{member.filename}", target))
+            yield inputs
+    else:
+        paths = [path for path in glob.glob(source, recursive=True)
+                 if os.path.isfile(path) and _is_supported(path)]
+        yield [(path, path) for path in sorted(paths)]
+
+
+def read_done(out_path):
+    """Ids already written to a JSONL output, for --resume"""
+    done = set()
+    if not os.path.exists(out_path):
+        return done
+    with open(out_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError, TypeError):
+                # A line cut short when the previous run was interrupted
+                continue
+    return done
+
+
+def truncate_partial_line(path, chunk_size=64 * 1024):
+    """Cut a JSONL file back to its last newline-terminated record.
+
+    A run killed mid-write leaves a half-written last line; appending after
+    it would make the file unreadable line by line.
+    """
+    try:
+        with open(path, 'r+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - chunk_size)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+    except FileNotFoundError:
+        pass
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def run_parse(args):
+    from cache import ResultCache, TextCache
+    from resume_parser import ResumeParser
+
+    fields = None
+    if args.fields:
+        try:
+            fields = check_fields(field.strip() for field in args.fields.split(',') if field.strip())
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+
+    if args.resume:
+        # Drop the record an interrupted run left half-written; its file is parsed again
+        truncate_partial_line(args.out)
+    done = read_done(args.out) if args.resume else set()
+    mode = 'a' if args.resume else 'w'
+
+    parser = ResumeParser(
+        offline=args.offline or None,
+        cache=ResultCache() if args.result_cache else None,
+        text_cache=TextCache() if args.text_cache else None,
+        pdf_profile=args.pdf_profile,
+    )
+    latencies = []
+    failed = 0
+    start = time.perf_counter()
+    with collect_inputs(args.source) as inputs:
+        ids = {path: input_id for input_id, path in inputs}
+        pending = [path for input_id, path in inputs if input_id not in done]
+        skipped = len(inputs) - len(pending)
+        if not inputs:
+            print(f"No resume files ({', '.join(SUPPORTED_SUFFIXES)}) found in {args.source}", file=sys.stderr)
+
+        with open(args.out, mode, encoding='utf-8') as out:
+            for path, result, seconds in parser.parse_many(pending, workers=args.jobs,
+                                                           chunksize=args.chunksize, timed=True,
+                                                           fields=fields):
+                record = {'path': ids[path]}
+                # parse_many already left out the fields not asked for
+                record.update(result)
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                latencies.append(seconds)
+                if not result.get('success'):
+                    failed += 1
+                if args.progress:
+                    print(f"[{len(latencies)}/{len(pending)}] {ids[path]}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    parsed = len(latencies)
+    print(
+        f"Parsed {parsed} files ({failed} failed, {skipped} already done) in {elapsed:.1f}s: "
+        f"{parsed / elapsed if elapsed else 0:.1f} docs/s, "
+        f"p50 {percentile(latencies, 50) * 1000:.0f} ms, p95 {percentile(latencies, 95) * 1000:.0f} ms",
+        file=sys.stderr
+    )
+    return 1 if failed and failed == parsed else 0
+
+
+def build_arg_parser():
+    arg_parser = argparse.ArgumentParser(prog="resume-parser", description="Parse resumes in bulk")
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+
+    parse = subparsers.add_parser('parse', help="parse a directory, glob pattern or zip of resumes to JSONL")
+    parse.add_argument('source', help="directory, glob pattern (quote it) or .zip archive")
+    parse.add_argument('--jobs', '-j', type=int, default=None, help="worker processes (default: CPU count)")
+    parse.add_argument('--out', '-o', default='results.jsonl', help="JSONL output file")
+    parse.add_argument('--fields', help=f"comma-separated result fields to compute and write "
+                                        f"({','.join(RESULT_FIELDS)}); success/error are always written")
+    parse.add_argument('--resume', action='store_true', help="skip files already in --out and append to it")
+    parse.add_argument('--chunksize', type=int, default=1, help="files handed to a worker at a time")
+    parse.add_argument('--offline', action='store_true', help="never download missing models")
+    parse.add_argument('--progress', action='store_true', help="print each file as it finishes")
+    parse.add_argument('--result-cache', action='store_true',
+                       help="reuse results for files parsed before with the same parser and taxonomy")
+    parse.add_argument('--text-cache', action='store_true',
+                       help="reuse extracted text so re-parses skip PDF/DOCX decoding")
+    parse.add_argument('--pdf-profile', choices=('fast', 'balanced', 'accurate', 'legacy'), default='balanced',
+                       help="PDF text extraction: fast (no layout analysis), balanced (two-column aware), "
+                            "accurate (layout analysis) or legacy (plain extract_text, no column reordering)")
+    parse.set_defaults(func=run_parse)
+    return arg_parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
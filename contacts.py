@@ -0,0 +1,184 @@
+import re
+import string
+
+# One scanner for LinkedIn and phone; a match names the field it found.
+# LinkedIn comes first so a profile URL is never read as something else,
+# and a phone never runs into an email address. Numbers with an explicit
+# "+CC" or "00CC" may be written in short groups ("+33 1 23 45 67 89");
+# without one, groups are at least two digits.
+CONTACT_RE = re.compile(r"""
+    (?P<linkedin>
+        (?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?P<kind>in|pub|company)/(?P<slug>[A-Za-z0-9_%-]+)
+    )
+  | (?P<phone>
+        (?<![\w+@])(?:\+|00)\d{1,3}(?:[\s.-]\d{1,4}){2,7}(?![\w@])
+      | (?<![\w+@])(?:\+|00)?\d{1,4}[\s.-]?(?:\(\d{1,4}\)[\s.-]?)?\d{2,4}(?:[\s.-]?\d{2,5}){1,4}(?![\w@])
+      | (?<![\w+@])\(\d{2,4}\)[\s.-]?\d{3,4}[\s.-]?\d{3,4}(?![\w@])
+    )
+""", re.IGNORECASE | re.VERBOSE)
+
+# Emails are found from each "@" instead: a pattern starting with the local
+# part is tried at every position and runs to the end of text such as
+# "1-1-1-..." before failing, which is quadratic. The local part is at most
+# 64 characters (RFC 5321).
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+MAX_EMAIL_LOCAL = 64
+EMAIL_DOMAIN_RE = re.compile(r'[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b')
+
+FIELDS = ('email', 'phone', 'linkedin')
+
+# E.164 allows at most 15 digits; fewer than 10 is a date, an ID or a local extension
+MIN_PHONE_DIGITS = 10
+MAX_PHONE_DIGITS = 15
+
+# Country code assumed for numbers written without one, as the old pattern did (NANP)
+DEFAULT_COUNTRY_CODE = '1'
+# How such a national number is grouped when it isn't one unbroken run (555 123 4567)
+NATIONAL_GROUPS = (3, 3, 4)
+
+# A number written without "+" only carries its own country code in a short first group
+MAX_COUNTRY_CODE_DIGITS = 3
+
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def normalize_phone(number, default_country_code=DEFAULT_COUNTRY_CODE):
+    """E.164 form of a phone number, or None if it can't be one.
+
+    A number without "+" or "00" is taken as national to
+    `default_country_code` when it has 10 digits (11 with a leading
+    country code); longer ones are assumed to already include it.
+    """
+    digits = ''.join(char for char in number if char.isdigit())
+    stripped = number.lstrip()
+    if stripped.startswith('+'):
+        pass
+    elif stripped.startswith('00'):
+        digits = digits[2:]
+    elif len(digits) == 10:
+        digits = default_country_code + digits
+    elif len(digits) == 11 and digits.startswith(default_country_code):
+        pass
+    elif digits.startswith('0'):
+        # A national trunk prefix: the country is unknown
+        return None
+    if not MIN_PHONE_DIGITS <= len(digits) <= MAX_PHONE_DIGITS:
+        return None
+    if digits.startswith('1') and len(digits) != 11:
+        # Every NANP number is +1 and ten digits
+        return None
+    return '+' + digits
+
+
+def _national(groups, default_country_code):
+    """E.164 form of digit groups that spell a whole national number, or None
+
+    Only one unbroken run or the NATIONAL_GROUPS grouping (after an
+    optional leading country code) is given the default country code;
+    "12345 67890" is an ID, not a phone number.
+    """
+    if len(groups) > 1 and groups[0] == default_country_code:
+        groups = groups[1:]
+    digits = ''.join(groups)
+    if len(groups) == 1:
+        national = len(digits) == 10 or (len(digits) == 10 + len(default_country_code)
+                                         and digits.startswith(default_country_code))
+    else:
+        national = tuple(len(group) for group in groups) == NATIONAL_GROUPS
+    return normalize_phone(digits, default_country_code) if national else None
+
+
+def parse_phone(number, default_country_code=DEFAULT_COUNTRY_CODE):
+    """E.164 form of the phone number in a CONTACT_RE match, or None.
+
+    The pattern is generous and can run on into a neighbouring number
+    ("78701 555-123-4567", "555-123-4567 2019"), so the match is cut at
+    its digit groups. A "+" or "00" number is the longest valid run of
+    groups from the start. Otherwise, in order: a national number at the
+    start, the whole match if its first group can be a country code
+    ("44 20 7946 0958"), then a national number at the end.
+    """
+    stripped = number.lstrip()
+    groups = _DIGITS_RE.findall(number)
+    if stripped.startswith(('+', '00')):
+        sign = '+' if stripped.startswith('+') else ''
+        for end in range(len(groups), 0, -1):
+            phone = normalize_phone(sign + ''.join(groups[:end]), default_country_code)
+            if phone is not None:
+                return phone
+        return None
+
+    for end in range(len(groups), 0, -1):
+        phone = _national(groups[:end], default_country_code)
+        if phone is not None:
+            return phone
+    if groups and len(groups[0]) <= MAX_COUNTRY_CODE_DIGITS and not groups[0].startswith('0'):
+        phone = normalize_phone('+' + ''.join(groups), default_country_code)
+        if phone is not None:
+            return phone
+    for start in range(1, len(groups)):
+        phone = _national(groups[start:], default_country_code)
+        if phone is not None:
+            return phone
+    return None
+
+
+def find_email(text):
+    """First email address in `text`, or None.
+
+    Each "@" is extended back over local-part characters, which stop at the
+    previous "@", and forward over a domain, so the whole search is linear.
+    """
+    at = text.find('@')
+    while at != -1:
+        start = at
+        while start > 0 and text[start - 1] in EMAIL_LOCAL_CHARS:
+            start -= 1
+        # Punctuation may not open the local part (".jane@" is "jane@")
+        local = text[start:at].lstrip('._%+-')
+        domain = EMAIL_DOMAIN_RE.match(text, at + 1)
+        if 0 < len(local) <= MAX_EMAIL_LOCAL and domain is not None:
+            return local + text[at:domain.end()]
+        at = text.find('@', at + 1)
+    return None
+
+
+def normalize_linkedin(kind, slug):
+    """Canonical profile URL: https://www.linkedin.com/in/<slug>, lowercase"""
+    return f"https://www.linkedin.com/{kind.lower()}/{slug.lower()}"
+
+
+def normalize_email(email):
+    local, _, domain = email.partition('@')
+    return f"{local}@{domain.lower()}"
+
+
+def scan(text, found=None, default_country_code=DEFAULT_COUNTRY_CODE):
+    """Fill `found` with normalized contact fields from `text`.
+
+    The email is found from the "@" signs, LinkedIn and phone in one pass.
+    Fields already in `found` are not looked for again, and the scan stops
+    as soon as all of FIELDS are present. Returns `found`.
+    """
+    found = {} if found is None else found
+    if 'email' not in found:
+        email = find_email(text)
+        if email is not None:
+            found['email'] = normalize_email(email)
+    if len(found) == len(FIELDS):
+        return found
+    for match in CONTACT_RE.finditer(text):
+        # The outermost group that matched: 'linkedin' or 'phone'
+        field = match.lastgroup
+        if field in found:
+            continue
+        if field == 'linkedin':
+            value = normalize_linkedin(match.group('kind'), match.group('slug'))
+        else:
+            value = parse_phone(match.group('phone'), default_country_code)
+        if value is None:
+            continue
+        found[field] = value
+        if len(found) == len(FIELDS):
+            break
+    return found
@@ -0,0 +1,97 @@
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+P = W + 'p'
+T = W + 't'
+TAB = W + 'tab'
+TABS = W + 'tabs'
+BREAKS = (W + 'br', W + 'cr')
+# Text boxes are stored twice: as DrawingML in mc:Choice and as VML in
+# mc:Fallback. Only the first copy is read.
+FALLBACK = MC + 'Fallback'
+
+DOCUMENT_PART = 'word/document.xml'
+HEADER_RE = re.compile(r'word/header\d*\.xml$')
+FOOTER_RE = re.compile(r'word/footer\d*\.xml$')
+
+
+def iter_part_paragraphs(stream):
+    """Yield the text of each non-empty paragraph of one WordprocessingML part.
+
+    The XML is parsed incrementally and each paragraph is dropped once its
+    text is taken. Table cells are visited where they occur, one paragraph
+    at a time, so a merged cell's text appears once (python-docx repeats it
+    for every grid column it spans). Paragraphs inside a text box are
+    yielded before the paragraph that anchors the box.
+    """
+    # Text runs of every paragraph still open; text boxes nest one inside another
+    open_paragraphs = []
+    skip = 0
+    in_tabs = 0
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == FALLBACK:
+                skip += 1
+            elif tag == TABS:
+                in_tabs += 1
+            elif tag == P and not skip:
+                open_paragraphs.append([])
+            continue
+
+        if tag == FALLBACK:
+            skip -= 1
+            elem.clear()
+        elif skip or not open_paragraphs:
+            continue
+        elif tag == T:
+            open_paragraphs[-1].append(elem.text or '')
+        elif tag == TABS:
+            in_tabs -= 1
+        elif tag == TAB and not in_tabs:
+            # Tab stops in paragraph properties are also w:tab; only run tabs are text
+            open_paragraphs[-1].append('\t')
+        elif tag in BREAKS:
+            open_paragraphs[-1].append('\n')
+        elif tag == P:
+            text = ''.join(open_paragraphs.pop())
+            elem.clear()
+            if text.strip():
+                yield text
+
+
+def _unique_paragraphs(archive, names):
+    seen = set()
+    for name in names:
+        with archive.open(name) as part:
+            for text in iter_part_paragraphs(part):
+                if text not in seen:
+                    seen.add(text)
+                    yield text
+
+
+def iter_paragraphs(file):
+    """Yield paragraph texts of a DOCX: headers, the body in document order, then footers.
+
+    `file` is a path or binary stream. Lines repeated across header or
+    footer parts (first-page, default and even-page variants) are yielded
+    once.
+    """
+    try:
+        with zipfile.ZipFile(file) as archive:
+            names = archive.namelist()
+            yield from _unique_paragraphs(archive, sorted(name for name in names if HEADER_RE.match(name)))
+            with archive.open(DOCUMENT_PART) as part:
+                yield from iter_part_paragraphs(part)
+            yield from _unique_paragraphs(archive, sorted(name for name in names if FOOTER_RE.match(name)))
+    except Exception as e:
+        raise Exception(f"DOCX extraction error: {str(e)}")
+
+
+def extract_text(file):
+    """The whole DOCX text, one paragraph per line"""
+    return "".join(text + "\n" for text in iter_paragraphs(file))
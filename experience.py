@@ -0,0 +1,61 @@
+import re
+from collections import namedtuple
+
+# One scanner for every "N years" phrase. The number is the anchor: the
+# optional lead-in before it is bounded to a few words, and nothing can
+# repeat unboundedly, so a scan is linear in the length of the text
+# however many times "experience" appears in it.
+YEARS_RE = re.compile(r"""
+    (?:\b(?P<lead>experience|worked\s+for)\b[^\d\n.]{0,40}?)?
+    \b(?P<years>\d{1,2}(?:\.\d)?)\s*(?:(?P<plus>\+)\s*)?(?:years?|yrs?)\b
+    (?P<tail>
+        \s+(?:of\s+)?(?:(?:professional|relevant|industry|work)\s+)?experience\b
+      | \s+(?:in|professional)\b
+    )?
+""", re.IGNORECASE | re.VERBOSE)
+
+# Years above this are dates or ages, not experience
+MAX_YEARS = 50
+
+# Scores, highest first: "5 years of experience", "experience of 5 years",
+# "5+ years in", and a bare "5 years" that is kept as a candidate only
+EXPLICIT, LEAD_IN, QUALIFIED, BARE = 3, 2, 1, 0
+
+YearsMention = namedtuple('YearsMention', ['years', 'text', 'start', 'end', 'plus', 'score'])
+
+
+def _score(match):
+    tail = match.group('tail')
+    if tail and tail.strip().lower().endswith('experience'):
+        return EXPLICIT
+    if match.group('lead'):
+        return LEAD_IN
+    if tail:
+        return QUALIFIED
+    return BARE
+
+
+def find_years(text):
+    """Every years-of-experience mention in `text`, in one pass.
+
+    Mentions are YearsMention tuples with the character offsets of the
+    whole phrase, ranked best first: by score, then by position, since a
+    figure in the summary usually comes before per-job durations.
+    """
+    mentions = []
+    for match in YEARS_RE.finditer(text):
+        years = float(match.group('years'))
+        if years > MAX_YEARS:
+            continue
+        mentions.append(YearsMention(match.group('years'), match.group(), match.start(), match.end(),
+                                     bool(match.group('plus')), _score(match)))
+    mentions.sort(key=lambda mention: (-mention.score, mention.start))
+    return mentions
+
+
+def best_years(mentions):
+    """The top-ranked mention that states experience, or None if there are only bare durations"""
+    for mention in mentions:
+        if mention.score > BARE:
+            return mention
+    return None
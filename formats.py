@@ -0,0 +1,168 @@
+import io
+import os
+import zipfile
+
+PDF = 'pdf'
+DOCX = 'docx'
+ODT = 'odt'
+RTF = 'rtf'
+HTML = 'html'
+MARKDOWN = 'markdown'
+TXT = 'txt'
+
+MIME_TYPES = {
+    PDF: 'application/pdf',
+    DOCX: 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    ODT: 'application/vnd.oasis.opendocument.text',
+    RTF: 'application/rtf',
+    HTML: 'text/html',
+    MARKDOWN: 'text/markdown',
+    TXT: 'text/plain',
+}
+
+SUFFIXES = {
+    '.pdf': PDF,
+    '.docx': DOCX,
+    '.odt': ODT,
+    '.rtf': RTF,
+    '.html': HTML,
+    '.htm': HTML,
+    '.md': MARKDOWN,
+    '.markdown': MARKDOWN,
+    '.txt': TXT,
+}
+
+# Some generators put junk before the PDF header; readers accept it within the first 1 KB
+PDF_HEADER_WINDOW = 1024
+ZIP_MAGIC = b'PK\x03\x04'
+# ODF packages store an uncompressed "mimetype" member first, so its content sits in the header
+ODT_MAGIC = b'mimetype' + MIME_TYPES[ODT].encode('ascii')
+RTF_MAGIC = b'{\\rtf'
+UTF8_BOM = b'\xef\xbb\xbf'
+UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+HTML_MARKERS = (b'<!doctype html', b'<html', b'<head', b'<body')
+
+# MIME type -> reader(file) returning the document's text; see register_reader()
+_READERS = {}
+
+
+def register_reader(mime_type, reader=None):
+    """Register `reader` for a MIME type; usable as a decorator.
+
+    A reader takes what ResumeSource.open() returns (a path or a binary
+    stream) and returns the document's text.
+    """
+    if reader is None:
+        return lambda reader: register_reader(mime_type, reader)
+    _READERS[mime_type] = reader
+    return reader
+
+
+def reader_for(mime_type):
+    return _READERS.get(mime_type)
+
+
+class ResumeSource:
+    """A resume given as a path, bytes, bytearray, memoryview or binary stream.
+
+    Streams are read once, so the same source can be hashed for the cache
+    and then handed to an extractor without touching the disk.
+    """
+
+    def __init__(self, source):
+        self.path = None
+        self.data = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.data = source
+            self.name = None
+        elif hasattr(source, 'read'):
+            self.data = source.read()
+            self.name = getattr(source, 'name', None)
+        else:
+            self.path = os.fspath(source)
+            self.name = self.path
+        self._format = None
+
+    def open(self):
+        """Something the format readers accept: the path, or a fresh in-memory stream"""
+        if self.path is not None:
+            return self.path
+        return io.BytesIO(self.data)
+
+    def read_bytes(self):
+        if self.data is not None:
+            return self.data
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def header(self, size=PDF_HEADER_WINDOW):
+        if self.data is not None:
+            return bytes(self.data[:size])
+        with open(self.path, 'rb') as f:
+            return f.read(size)
+
+    @property
+    def format(self):
+        """One of the format constants or None, from magic bytes, falling back to the file name"""
+        if self._format is None:
+            self._format = detect_format(self) or format_from_name(self.name)
+        return self._format
+
+    @property
+    def mime_type(self):
+        return MIME_TYPES.get(self.format)
+
+
+def as_source(source):
+    return source if isinstance(source, ResumeSource) else ResumeSource(source)
+
+
+def format_from_name(name):
+    if not isinstance(name, str):
+        return None
+    return SUFFIXES.get(os.path.splitext(name)[1].lower())
+
+
+def _is_text(header):
+    if header.startswith(UTF16_BOMS):
+        return True
+    if b'\x00' in header:
+        return False
+    # Tolerate a few stray control bytes, as long as it is mostly text
+    controls = sum(1 for byte in header if byte < 32 and byte not in b'\t\n\r\f')
+    return controls <= len(header) // 100
+
+
+def detect_format(source):
+    """Sniff the format of a ResumeSource from its leading bytes.
+
+    Binary formats are recognised by magic bytes alone. Text that is not
+    RTF or HTML is Markdown when the file name says so, plain text
+    otherwise.
+    """
+    header = source.header()
+    if b'%PDF-' in header:
+        return PDF
+    if header.startswith(ZIP_MAGIC):
+        if ODT_MAGIC in header:
+            return ODT
+        try:
+            with zipfile.ZipFile(source.open()) as archive:
+                names = archive.namelist()
+        except zipfile.BadZipFile:
+            return None
+        if 'word/document.xml' in names:
+            return DOCX
+        if 'content.xml' in names:
+            return ODT
+        return None
+    if not header or not _is_text(header):
+        return None
+    start = header.lstrip(UTF8_BOM).lstrip()
+    if start.startswith(RTF_MAGIC):
+        return RTF
+    if start.startswith(b'<') and any(marker in header.lower() for marker in HTML_MARKERS):
+        return HTML
+    if format_from_name(source.name) in (MARKDOWN, HTML):
+        return format_from_name(source.name)
+    return TXT
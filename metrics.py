@@ -0,0 +1,217 @@
+import bisect
+import contextlib
+import threading
+import time
+import tracemalloc
+
+# Histogram buckets in seconds, roughly matching Prometheus client defaults
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=None):
+    pairs = list(key) + (list(extra.items()) if extra else [])
+    if not pairs:
+        return ""
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class Counter:
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [bucket counts..., +Inf count, sum]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, **labels):
+        series = self._values.get(_label_key(labels))
+        return sum(series[:-1]) if series else 0
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key, {'le': repr(float(bound))})} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_format_labels(key, {'le': '+Inf'})} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process counters and histograms with a Prometheus text exporter.
+
+    This is the default metrics sink for ResumeParser; any object with the
+    same observe_stage() and count() methods can be used instead.
+    """
+
+    def __init__(self, prefix="resume_parser"):
+        self.prefix = prefix
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, **kwargs):
+        name = f"{self.prefix}_{name}"
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, **kwargs)
+        return metric
+
+    def counter(self, name, help_text=""):
+        return self._get(Counter, name, help_text)
+
+    def histogram(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def observe_stage(self, stage, timing):
+        """Record one stage's timing dict as produced by StageRecorder"""
+        self.histogram('stage_seconds', "Wall time per parse stage").observe(
+            timing['wall_ms'] / 1000, stage=stage)
+        self.histogram('stage_cpu_seconds', "CPU time per parse stage").observe(
+            timing['cpu_ms'] / 1000, stage=stage)
+        if 'peak_kb' in timing:
+            self.histogram('stage_peak_bytes', "Peak traced allocation per parse stage",
+                           buckets=(2**16, 2**18, 2**20, 2**22, 2**24, 2**26, 2**28)).observe(
+                timing['peak_kb'] * 1024, stage=stage)
+
+    def count(self, name, amount=1, **labels):
+        self.counter(f"{name}_total", f"Total {name.replace('_', ' ')}").inc(amount, **labels)
+
+    def render_prometheus(self):
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsBuffer:
+    """Metrics sink that keeps what it is given so it can be replayed elsewhere.
+
+    parse_many's pool workers record into one and send the events back with
+    each result, so the caller's registry also covers pooled runs.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def observe_stage(self, stage, timing):
+        self.events.append(('observe_stage', (stage, timing), {}))
+
+    def count(self, name, amount=1, **labels):
+        self.events.append(('count', (name, amount), labels))
+
+    def drain(self):
+        """The events recorded since the last drain"""
+        events, self.events = self.events, []
+        return events
+
+
+def replay(events, sink):
+    """Feed MetricsBuffer events into another metrics sink"""
+    for method, args, labels in events:
+        getattr(sink, method)(*args, **labels)
+
+
+class StageRecorder:
+    """Times named stages: wall, CPU and optionally peak traced allocation"""
+
+    enabled = True
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.stages = {}
+        self._started_tracing = False
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            timing = {
+                'wall_ms': round((time.perf_counter() - wall) * 1000, 3),
+                'cpu_ms': round((time.thread_time() - cpu) * 1000, 3),
+            }
+            if self.track_memory:
+                timing['peak_kb'] = round(max(0, tracemalloc.get_traced_memory()[1] - base) / 1024, 1)
+            self.stages[name] = timing
+
+    def close(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self):
+        """Per-stage timings plus a 'total' entry summing wall and CPU time"""
+        timings = dict(self.stages)
+        timings['total'] = {
+            'wall_ms': round(sum(t['wall_ms'] for t in self.stages.values()), 3),
+            'cpu_ms': round(sum(t['cpu_ms'] for t in self.stages.values()), 3),
+        }
+        return timings
+
+
+class NullRecorder:
+    """Stand-in used when instrumentation is off; stage() costs one call"""
+
+    enabled = False
+    stages = {}
+    _null = contextlib.nullcontext()
+
+    def stage(self, name):
+        return self._null
+
+    def close(self):
+        pass
+
+
+NULL_RECORDER = NullRecorder()
@@ -0,0 +1,282 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+# Basic English stopword list used when the NLTK corpus is not installed
+FALLBACK_STOP_WORDS = {
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you',
+    "you're", "you've", "you'll", "you'd", 'your', 'yours', 'yourself',
+    'yourselves', 'he', 'him', 'his', 'himself', 'she', "she's", 'her',
+    'hers', 'herself', 'it', "it's", 'its', 'itself', 'they', 'them',
+    'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom',
+    'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having',
+    'do', 'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if',
+    'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for',
+    'with', 'about', 'against', 'between', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in',
+    'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'any',
+    'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
+    's', 't', 'can', 'will', 'just', 'don', "don't", 'should', "should've",
+    'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', "aren't",
+    'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't", 'hadn',
+    "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn', "isn't", 'ma',
+    'mightn', "mightn't", 'mustn', "mustn't", 'needn', "needn't", 'shan',
+    "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't",
+    'won', "won't", 'wouldn', "wouldn't"
+}
+
+
+# Pipes a component cannot run without (listeners need their embedding source)
+COMPONENT_REQUIRES = {
+    'ner': ('transformer',),
+    'tagger': ('tok2vec', 'transformer'),
+    'parser': ('tok2vec', 'transformer'),
+    'senter': ('tok2vec', 'transformer'),
+    'morphologizer': ('tok2vec', 'transformer'),
+    'attribute_ruler': ('tagger',),
+    'lemmatizer': ('tagger', 'attribute_ruler'),
+}
+
+
+def pipeline_names(name):
+    """Component names of an installed pipeline, read from its meta.json without loading it"""
+    from pathlib import Path
+    from spacy import util
+
+    path = util.get_package_path(name) if util.is_package(name) else Path(name)
+    meta = util.get_model_meta(path)
+    return list(meta.get('components') or meta.get('pipeline') or [])
+
+
+def resolve_components(pipeline, components):
+    """Expand `components` with everything they depend on, limited to `pipeline`"""
+    pipeline = set(pipeline)
+    needed = set()
+    pending = [c for c in components if c in pipeline]
+    while pending:
+        component = pending.pop()
+        if component in needed:
+            continue
+        needed.add(component)
+        pending.extend(c for c in COMPONENT_REQUIRES.get(component, ()) if c in pipeline)
+    return needed
+
+
+def load_pipeline(spacy, name, components=None):
+    """spacy.load, excluding every pipe that `components` does not need"""
+    if components is None:
+        return spacy.load(name)
+    try:
+        pipeline = pipeline_names(name)
+    except Exception:
+        # No readable meta.json: load everything, then drop what isn't needed
+        nlp = spacy.load(name)
+        needed = resolve_components(nlp.pipe_names, components)
+        for pipe in [p for p in nlp.pipe_names if p not in needed]:
+            nlp.remove_pipe(pipe)
+        return nlp
+    needed = resolve_components(pipeline, components)
+    return spacy.load(name, exclude=[p for p in pipeline if p not in needed])
+
+
+def offline_from_env():
+    """Read offline mode from the RESUME_PARSER_OFFLINE environment variable"""
+    return os.environ.get("RESUME_PARSER_OFFLINE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class ModelRegistry:
+    """Loads heavy NLP resources once, on first use.
+
+    In offline mode the registry never downloads anything: a missing spaCy
+    model raises OSError and missing NLTK data falls back to built-in lists.
+    Every load is timed so cold-start cost can be inspected with report().
+    """
+
+    def __init__(self, offline=None, download_timeout=120):
+        self.offline = offline_from_env() if offline is None else offline
+        self.download_timeout = download_timeout
+        self._resources = {}
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key, loader):
+        # Fast path without the lock once a resource is loaded
+        if key in self._resources:
+            return self._resources[key]
+        with self._lock:
+            if key not in self._resources:
+                start = time.perf_counter()
+                value, source = loader()
+                self._timings[key] = {
+                    'seconds': round(time.perf_counter() - start, 4),
+                    'source': source
+                }
+                self._resources[key] = value
+        return self._resources[key]
+
+    def is_loaded(self, key):
+        return key in self._resources
+
+    def get_nlp(self, name=DEFAULT_SPACY_MODEL, components=None):
+        """Return the spaCy pipeline `name`, loading it on first call.
+
+        With `components`, every pipe not needed by them is excluded at load
+        time so its weights are never read into memory.
+        """
+        if components is not None:
+            components = tuple(sorted(set(components)))
+        return self._get(('spacy', name, components), lambda: self._load_spacy(name, components))
+
+    def get_stop_words(self, language='english'):
+        """Return the NLTK stopword set, or the built-in list if unavailable"""
+        return self._get(('stopwords', language), lambda: self._load_stop_words(language))
+
+    def _load_spacy(self, name, components=None):
+        import spacy
+
+        try:
+            return load_pipeline(spacy, name, components), 'installed'
+        except OSError:
+            if self.offline:
+                raise OSError(
+                    f"spaCy model '{name}' is not installed and offline mode is enabled. "
+                    f"Install it with: python -m spacy download {name}"
+                )
+        self._download(["spacy", "download", name])
+        return load_pipeline(spacy, name, components), 'downloaded'
+
+    def _load_stop_words(self, language):
+        try:
+            import nltk
+            from nltk.corpus import stopwords
+        except ImportError:
+            return set(FALLBACK_STOP_WORDS), 'fallback'
+
+        try:
+            return set(stopwords.words(language)), 'installed'
+        except LookupError:
+            pass
+
+        if not self.offline:
+            try:
+                if nltk.download('stopwords', quiet=True, raise_on_error=True):
+                    return set(stopwords.words(language)), 'downloaded'
+            except Exception as e:
+                print(f"NLTK download warning: {e}")
+        return set(FALLBACK_STOP_WORDS), 'fallback'
+
+    def _download(self, args):
+        """Run `python -m <args>` with a timeout so a worker can never hang on it"""
+        print(f"Downloading: {' '.join(args[1:])}...")
+        try:
+            subprocess.run([sys.executable, "-m"] + args, check=True, timeout=self.download_timeout)
+        except subprocess.TimeoutExpired:
+            raise OSError(f"Download timed out after {self.download_timeout}s: {' '.join(args)}")
+        except subprocess.CalledProcessError as e:
+            raise OSError(f"Download failed with exit code {e.returncode}: {' '.join(args)}")
+
+    def warm_up(self, name=DEFAULT_SPACY_MODEL, components=None):
+        """Load every resource the parser needs up front"""
+        self.get_nlp(name, components)
+        self.get_stop_words()
+        return self.report()
+
+    def report(self):
+        """Timing report for every resource loaded so far"""
+        resources = {}
+        for key, timing in self._timings.items():
+            kind, name = key[0], key[1]
+            label = f"{kind}:{name}"
+            if kind == 'spacy' and key[2] is not None:
+                label += "[" + ",".join(key[2]) + "]"
+            resources[label] = dict(timing)
+        return {
+            'offline': self.offline,
+            'resources': resources,
+            'total_seconds': round(sum(t['seconds'] for t in self._timings.values()), 4)
+        }
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_registry():
+    """Process-wide registry shared by every ResumeParser that doesn't get its own"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = ModelRegistry()
+    return _default_registry
+
+
+def _measure_load(name, components):
+    import gc
+    import tracemalloc
+
+    import spacy
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    nlp = load_pipeline(spacy, name, components)
+    seconds = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return nlp.pipe_names, seconds, allocated
+
+
+def compare_pruning(name=DEFAULT_SPACY_MODEL, components=('ner',)):
+    """Load time and traced memory of the full pipeline versus a pruned one"""
+    full_pipes, full_seconds, full_bytes = _measure_load(name, None)
+    pruned_pipes, pruned_seconds, pruned_bytes = _measure_load(name, components)
+    return {
+        'model': name,
+        'full': {'pipes': full_pipes, 'seconds': round(full_seconds, 4), 'mb': round(full_bytes / 2**20, 1)},
+        'pruned': {'pipes': pruned_pipes, 'seconds': round(pruned_seconds, 4), 'mb': round(pruned_bytes / 2**20, 1)},
+        'seconds_saved': round(full_seconds - pruned_seconds, 4),
+        'mb_saved': round((full_bytes - pruned_bytes) / 2**20, 1)
+    }
+
+
+def main(argv=None):
+    """Warm every resource and print the startup report, e.g. for a CI cold-start check"""
+    import argparse
+    import json
+
+    arg_parser = argparse.ArgumentParser(description="Measure resume parser model startup time")
+    arg_parser.add_argument("--model", default=DEFAULT_SPACY_MODEL)
+    arg_parser.add_argument("--offline", action="store_true", help="never download missing resources")
+    arg_parser.add_argument("--max-seconds", type=float, help="exit with status 1 if startup exceeds this")
+    arg_parser.add_argument("--components", help="comma-separated pipes to keep, e.g. 'ner'")
+    arg_parser.add_argument("--compare-pruning", action="store_true",
+                            help="load the full and the pruned pipeline and report time and memory saved")
+    args = arg_parser.parse_args(argv)
+    components = [c for c in args.components.split(",") if c] if args.components is not None else None
+
+    if args.compare_pruning:
+        print(json.dumps(compare_pruning(args.model, components or ['ner']), indent=2))
+        return 0
+
+    import_start = time.perf_counter()
+    registry = ModelRegistry(offline=args.offline or None)
+    report = registry.warm_up(args.model, components)
+    report['wall_seconds'] = round(time.perf_counter() - import_start, 4)
+    print(json.dumps(report, indent=2))
+
+    if args.max_seconds is not None and report['wall_seconds'] > args.max_seconds:
+        print(f"Startup took {report['wall_seconds']}s, over the {args.max_seconds}s budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import re
+
+import normalizer
+import sections
+
+# The name is almost always in the first few lines of the raw text
+MAX_HEADER_LINES = 5
+
+# At or above this confidence the header line is trusted and NER is skipped
+CONFIDENT = 0.8
+
+# Lines containing these are a title, a heading, an organisation or a
+# document label, not a person
+NOT_NAME_WORDS = frozenset("""
+    resume curriculum vitae cv profile contact summary objective
+    engineer developer manager analyst consultant designer architect scientist
+    intern student senior junior director specialist administrator officer
+    software data web full stack frontend backend devops cloud product project
+    email phone mobile linkedin github address road avenue
+    personal details information info highlights achievements accomplishments
+    career experience education skills qualifications professional work history
+    overview statement references interests core about
+    inc ltd llc corp corporation company limited plc gmbh group holdings
+    technologies solutions services systems international
+    university college institute school academy
+""".split())
+
+# Common surnames ("Jimmy Page", "Jane Street") that open a heading or
+# title ("Key Skills", "Lead Engineer", "Street Address"); they rule a line
+# out only as its first word
+NOT_FIRST_NAME_WORDS = frozenset({'page', 'street', 'key', 'lead'})
+
+# With more than one name-shaped line the header is ambiguous ("Jane Smith"
+# over "San Francisco"); the best line is capped below CONFIDENT so NER decides
+AMBIGUOUS = 0.6
+
+# A first line that only labels the document doesn't push the name down
+DOCUMENT_LABELS = frozenset({'resume', 'résumé', 'curriculum', 'vitae', 'cv'})
+
+# "John Smith | Senior Engineer", "JANE DOE, MBA", "John Smith - Resume"
+_SEGMENT_RE = re.compile(r'\s+[|•·–—-]\s+|\s*[|•·,;:\t]\s*')
+_TOKEN_RE = re.compile(r"^(?:[A-Z][a-zA-Z'’-]*|[A-Z]\.|[a-z]{1,3})$")
+_LOWER_PARTICLES = frozenset({'de', 'da', 'del', 'der', 'di', 'du', 'la', 'le', 'van', 'von', 'bin', 'al'})
+
+
+def _display(candidate):
+    # "JOHN SMITH" -> "John Smith"; mixed-case names such as "McDonald" are left alone
+    if candidate.isupper():
+        return ' '.join(token.capitalize() for token in candidate.split())
+    return candidate
+
+
+def score_line(line, position):
+    """(candidate, confidence in [0, 1]) for one header line at 0-based `position`"""
+    line = normalizer.clean(line)
+    if not line or '@' in line or '/' in line or any(char.isdigit() for char in line):
+        return None, 0.0
+    if sections.heading_section(line) is not None:
+        return None, 0.0
+    candidate = _SEGMENT_RE.split(line, 1)[0].strip()
+    tokens = candidate.split()
+    if not 2 <= len(tokens) <= 4:
+        return None, 0.0
+    words = [token.lower().strip(".'’-") for token in tokens]
+    if words[0] in NOT_FIRST_NAME_WORDS or any(word in NOT_NAME_WORDS for word in words):
+        return None, 0.0
+
+    display = _display(candidate)
+    shaped = [token for token in display.split()
+              if _TOKEN_RE.match(token) and (token[0].isupper() or token in _LOWER_PARTICLES)]
+    if len(shaped) < len(tokens):
+        return None, 0.0
+
+    confidence = 0.4
+    if len(tokens) <= 3:
+        confidence += 0.2
+    if candidate == line:
+        # Nothing else on the line, like a title or a phone number
+        confidence += 0.15
+    confidence += (0.25, 0.1)[position] if position < 2 else 0.0
+    return display, round(min(confidence, 1.0), 2)
+
+
+def header_name(raw_text, max_lines=MAX_HEADER_LINES):
+    """Best (name, confidence) from the first non-empty lines of the raw text.
+
+    ("Not found", 0.0) when no line looks like a name. Uses the line
+    structure the extractor produced, before normalization flattens it.
+    When several lines look like a name, none is confident.
+    """
+    best = ("Not found", 0.0)
+    shaped = 0
+    position = 0
+    for line in raw_text.splitlines():
+        if not line.strip():
+            continue
+        if all(word.strip(':.-').lower() in DOCUMENT_LABELS for word in line.split()):
+            continue
+        candidate, confidence = score_line(line, position)
+        if confidence:
+            shaped += 1
+        if confidence > best[1]:
+            best = (candidate, confidence)
+        position += 1
+        if position >= max_lines:
+            break
+    if shaped > 1:
+        return best[0], min(best[1], AMBIGUOUS)
+    return best
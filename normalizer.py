@@ -0,0 +1,106 @@
+import re
+from bisect import bisect_right
+
+# One-to-one replacements for non-ASCII characters with an ASCII equivalent
+_TRANSLATE = {}
+for _chars, _replacement in (
+    ("\u2018\u2019\u201a\u201b\u2032", "'"),
+    ("\u201c\u201d\u201e\u201f\u2033", '"'),
+    ("\u2010\u2011\u2012\u2013\u2014\u2015\u2212", "-"),
+    ("\u2044\u2215", "/"),
+    ("\uff0b", "+"),
+    ("\u266f", "#"),
+    ("\u2024", "."),
+    # Bullets and separators resumes use between list items
+    ("\u2022\u2023\u2043\u2219\u00b7\u25aa\u25ab\u25a0\u25a1\u25cf\u25cb\u25e6\u27a2\u2756\uf0b7\uf0a7\uf0d8", " "),
+):
+    for _char in _chars:
+        _TRANSLATE[ord(_char)] = _replacement
+TRANSLATE_TABLE = str.maketrans(_TRANSLATE)
+
+# Runs of anything but printable ASCII and ordinary whitespace. Plain resume
+# text rarely matches, so this is the only per-character work done in Python
+SPECIAL_RE = re.compile(r'[^\t\n\r -~]+')
+# Separators in marked-up text that need rewriting: junk (marked \x00) is
+# dropped and any other whitespace run becomes one space unless it already is
+SEPARATOR_RE = re.compile(r'\x00+(?:(\s)[\s\x00]*)?|( )[\s\x00]+|([^\S ])[\s\x00]*')
+LEADING_RE = re.compile(r'[\s\x00]*')
+
+
+def _is_kept(char):
+    # Word characters, whitespace and printable ASCII; c++, c#, ci/cd, emails
+    # and URLs are all made of these, so they survive intact
+    return char.isalnum() or char == '_' or char.isspace() or ' ' <= char <= '~'
+
+
+def _clean_run(match):
+    return ''.join(c for c in match.group().translate(TRANSLATE_TABLE) if _is_kept(c))
+
+
+def _mark_run(match):
+    # Like _clean_run but keeps the length, marking dropped characters
+    return ''.join(c if _is_kept(c) else '\x00' for c in match.group().translate(TRANSLATE_TABLE))
+
+
+class OffsetMap:
+    """Maps offsets in normalized text back to offsets in the original"""
+
+    def __init__(self, normalized_starts, original_starts):
+        self._normalized_starts = normalized_starts
+        self._original_starts = original_starts
+
+    def to_original(self, offset):
+        segment = bisect_right(self._normalized_starts, offset) - 1
+        if segment < 0:
+            return 0
+        return self._original_starts[segment] + offset - self._normalized_starts[segment]
+
+    def span_to_original(self, start, end):
+        """Original (start, end) for a normalized span"""
+        if end <= start:
+            original = self.to_original(start)
+            return original, original
+        return self.to_original(start), self.to_original(end - 1) + 1
+
+
+def clean(text):
+    """Collapse whitespace and drop stray symbols, keeping technical tokens"""
+    if not text:
+        return ""
+    return ' '.join(SPECIAL_RE.sub(_clean_run, text).split())
+
+
+def normalize(text):
+    """clean() plus an OffsetMap from the normalized text back to `text`"""
+    if not text:
+        return "", OffsetMap([0], [0])
+
+    text = SPECIAL_RE.sub(_mark_run, text)
+    pieces = []
+    normalized_starts = []
+    original_starts = []
+    length = 0
+    position = LEADING_RE.match(text).end()
+    for match in SEPARATOR_RE.finditer(text, position):
+        start, end = match.span()
+        if start > position:
+            normalized_starts.append(length)
+            original_starts.append(position)
+            pieces.append(text[position:start])
+            length += start - position
+        if match.lastindex:
+            normalized_starts.append(length)
+            original_starts.append(start)
+            pieces.append(' ')
+            length += 1
+        position = end
+    if position < len(text):
+        normalized_starts.append(length)
+        original_starts.append(position)
+        pieces.append(text[position:])
+    normalized = ''.join(pieces)
+    if normalized.endswith(' '):
+        normalized = normalized[:-1]
+    if not normalized_starts:
+        normalized_starts, original_starts = [0], [0]
+    return normalized, OffsetMap(normalized_starts, original_starts)
@@ -0,0 +1,409 @@
+import io
+import multiprocessing
+import os
+from collections import namedtuple
+
+import pdfplumber
+
+# Below this many pages, starting a pool costs more than decoding serially
+PARALLEL_MIN_PAGES = 20
+
+# How a page's text was obtained
+TEXT = 'text'              # page.extract_text() with default tolerances
+TEXT_TIGHT = 'text_tight'  # retried with x/y tolerance 1
+COLUMNS = 'columns'        # words of a two-column page, left column first
+TABLES = 'tables'          # joined table cells
+CHARS = 'chars'            # raw chars grouped into lines, no layout analysis (fast profile)
+LAYOUT = 'layout'          # pdfminer text boxes in reading order (accurate profile)
+EMPTY = 'empty'            # no printable characters on the page (a scan, or blank)
+ERROR = 'error'            # the page failed to decode
+STRATEGIES = (TEXT, TEXT_TIGHT, COLUMNS, TABLES, CHARS, LAYOUT, EMPTY, ERROR)
+
+# Extraction profiles, from cheapest to most faithful to the page layout.
+# LEGACY is plain page.extract_text(), the output of releases before
+# column detection, for callers whose downstream rules depend on it.
+FAST = 'fast'
+BALANCED = 'balanced'
+ACCURATE = 'accurate'
+LEGACY = 'legacy'
+DEFAULT_PROFILE = BALANCED
+
+# Chars or words this close vertically share a line; in the fast profile a
+# wider horizontal gap than SPACE_TOLERANCE becomes a space (pdfplumber's defaults)
+LINE_TOLERANCE = 3
+SPACE_TOLERANCE = 3
+
+# Column detection: the right column must start in the middle of the page,
+# after a gap wider than a word space, on enough lines to not be a stray
+# right-aligned date
+COLUMN_ZONE = (0.25, 0.75)
+MIN_GUTTER = 12
+COLUMN_ALIGN_TOLERANCE = 4
+MIN_COLUMN_LINES = 4
+MIN_COLUMN_SHARE = 0.3
+# A table row keeps both cells in one line box: a short label on the left
+# (at most MAX_KEY_WORDS words) set on the same top and bottom, within
+# ROW_ALIGN_TOLERANCE, as the value on the right. Two independent columns
+# (a sidebar beside the main text) have their own fonts and leading, and
+# their lines only happen to meet within LINE_TOLERANCE. A sidebar set in
+# the main text's font and grid with short lines looks like a table and
+# keeps the row-by-row order of page.extract_text().
+MAX_KEY_WORDS = 3
+ROW_ALIGN_TOLERANCE = 0.5
+MIN_TABLE_ROWS = 2
+
+# Accurate profile: pdfminer layout analysis; boxes_flow orders text boxes column by column
+LAPARAMS = {'line_margin': 0.5, 'char_margin': 2.0, 'word_margin': 0.1, 'boxes_flow': 0.5}
+
+PageText = namedtuple('PageText', ['number', 'text', 'strategy'])
+
+
+def _release(page):
+    """Drop a page's parsed objects once its text has been taken"""
+    # Page.close() flushes the cache on pdfplumber >= 0.10; older releases only have flush_cache()
+    close = getattr(page, 'close', None) or getattr(page, 'flush_cache', None)
+    if close is not None:
+        close()
+
+
+def _has_printable_chars(page):
+    # page.chars is parsed anyway by extract_text; checking it first skips
+    # both text passes and the table search on image-only pages
+    return any(not char['text'].isspace() for char in page.chars)
+
+
+def _table_text(page):
+    lines = []
+    for table in page.extract_tables():
+        for row in table:
+            if row:
+                lines.append(' '.join([str(cell) for cell in row if cell]))
+    return "\n".join(lines)
+
+
+def _group_lines(objects):
+    """Group chars or words into lines by their top edge, each line ordered left to right"""
+    lines = []
+    line = []
+    line_top = None
+    for obj in sorted(objects, key=lambda obj: (obj['top'], obj['x0'])):
+        if line_top is None or obj['top'] - line_top > LINE_TOLERANCE:
+            line = []
+            lines.append(line)
+            line_top = obj['top']
+        line.append(obj)
+    for line in lines:
+        line.sort(key=lambda obj: obj['x0'])
+    return lines
+
+
+def find_column_split(lines, page_width):
+    """x where a second column starts, or None for a single-column page.
+
+    Words that open the right column share a left edge: cluster the left
+    edges of words that start in the middle of the page after a gutter,
+    and accept the best-supported one if enough lines have a word there.
+    """
+    low, high = page_width * COLUMN_ZONE[0], page_width * COLUMN_ZONE[1]
+    starts = []
+    for line in lines:
+        last_x1 = None
+        for word in line:
+            if low <= word['x0'] <= high and (last_x1 is None or word['x0'] - last_x1 >= MIN_GUTTER):
+                starts.append(word['x0'])
+                break
+            last_x1 = word['x1']
+    if len(starts) < MIN_COLUMN_LINES:
+        return None
+
+    starts.sort()
+    best_size, best_x = 0, None
+    first = 0
+    for last, x in enumerate(starts):
+        while x - starts[first] > COLUMN_ALIGN_TOLERANCE:
+            first += 1
+        if last - first + 1 > best_size:
+            best_size, best_x = last - first + 1, starts[first]
+    if best_size < max(MIN_COLUMN_LINES, MIN_COLUMN_SHARE * len(lines)):
+        return None
+    return best_x - COLUMN_ALIGN_TOLERANCE
+
+
+def _sides(line, split):
+    """(words left of `split`, words right of it), or None if a word crosses it"""
+    if any(word['x0'] < split < word['x1'] for word in line):
+        return None
+    return ([word for word in line if word['x1'] <= split],
+            [word for word in line if word['x0'] >= split])
+
+
+def _join_words(line):
+    return ' '.join(word['text'] for word in line)
+
+
+def _is_table_row(left_words, right_words):
+    """Whether a line with words on both sides is a label and its value in one table row"""
+    if len(left_words) > MAX_KEY_WORDS:
+        return False
+    return (abs(min(w['top'] for w in left_words) - min(w['top'] for w in right_words)) <= ROW_ALIGN_TOLERANCE
+            and abs(max(w['bottom'] for w in left_words) - max(w['bottom'] for w in right_words)) <= ROW_ALIGN_TOLERANCE)
+
+
+def _is_table(run):
+    """Whether every line of `run` with words on both sides is a table row"""
+    rows = [(left_words, right_words) for left_words, right_words in run if left_words and right_words]
+    return len(rows) >= MIN_TABLE_ROWS and all(_is_table_row(*row) for row in rows)
+
+
+def column_text(lines, split):
+    """(text, whether any of it was read as two columns) of a page split at `split`.
+
+    Runs of lines with nothing crossing `split` are emitted left column
+    first, then right; lines that cross it (a full-width name or heading)
+    are emitted in place between those runs. A run whose two-sided lines
+    are all label/value rows (see _is_table_row) is a table and is kept
+    row by row, however many of its lines have one side only.
+    """
+    out = []
+    run = []
+    two_columns = False
+
+    def flush():
+        nonlocal two_columns
+        if _is_table(run):
+            out.extend(_join_words(left_words + right_words) for left_words, right_words in run)
+        else:
+            left = [_join_words(left_words) for left_words, _ in run if left_words]
+            right = [_join_words(right_words) for _, right_words in run if right_words]
+            two_columns = two_columns or bool(left and right)
+            out.extend(left)
+            out.extend(right)
+        run.clear()
+
+    for line in lines:
+        sides = _sides(line, split)
+        if sides is None:
+            flush()
+            out.append(_join_words(line))
+        else:
+            run.append(sides)
+    flush()
+    return "\n".join(out), two_columns
+
+
+def words_text(page, **tolerances):
+    """(text, whether it was read as two columns) from the page's words"""
+    lines = _group_lines(page.extract_words(**tolerances))
+    split = find_column_split(lines, page.width)
+    if split is None:
+        return "\n".join(_join_words(line) for line in lines), False
+    return column_text(lines, split)
+
+
+def read_page(page):
+    """(text, strategy) for one page, trying each strategy only while it can still help"""
+    if not _has_printable_chars(page):
+        return "", EMPTY
+    page_text, two_columns = words_text(page)
+    if page_text:
+        return page_text, COLUMNS if two_columns else TEXT
+    page_text, two_columns = words_text(page, x_tolerance=1, y_tolerance=1)
+    if page_text:
+        return page_text, COLUMNS if two_columns else TEXT_TIGHT
+    page_text = _table_text(page)
+    if page_text:
+        return page_text, TABLES
+    return "", EMPTY
+
+
+def read_page_legacy(page):
+    """page.extract_text() with the tight-tolerance and table fallbacks, never reordering columns"""
+    if not _has_printable_chars(page):
+        return "", EMPTY
+    page_text = page.extract_text()
+    if page_text:
+        return page_text, TEXT
+    page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
+    if page_text:
+        return page_text, TEXT_TIGHT
+    page_text = _table_text(page)
+    if page_text:
+        return page_text, TABLES
+    return "", EMPTY
+
+
+def _line_text(line):
+    parts = []
+    last_x1 = None
+    for char in line:
+        text = char['text']
+        if (last_x1 is not None and char['x0'] - last_x1 > SPACE_TOLERANCE
+                and parts[-1] != ' ' and text != ' '):
+            parts.append(' ')
+        parts.append(text)
+        last_x1 = char['x1']
+    return ''.join(parts).strip()
+
+
+def read_page_fast(page):
+    """Chars straight into lines, skipping word extraction, layout and tables"""
+    if not _has_printable_chars(page):
+        return "", EMPTY
+    lines = (_line_text(line) for line in _group_lines(page.chars))
+    return "\n".join(line for line in lines if line), CHARS
+
+
+def read_page_accurate(page):
+    """pdfminer's text boxes in reading order, so side-by-side columns are not interleaved"""
+    if not _has_printable_chars(page):
+        return "", EMPTY
+    boxes = page.objects.get('textboxhorizontal', [])
+    page_text = "\n".join(box['text'].strip() for box in boxes if box['text'].strip())
+    if page_text:
+        return page_text, LAYOUT
+    return read_page(page)
+
+
+# Profile -> (page reader, extra pdfplumber.open() arguments)
+PROFILES = {
+    FAST: (read_page_fast, {}),
+    BALANCED: (read_page, {}),
+    ACCURATE: (read_page_accurate, {'laparams': LAPARAMS}),
+    LEGACY: (read_page_legacy, {}),
+}
+
+
+def check_profile(profile):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown PDF extraction profile {profile!r}. Choose from: {', '.join(PROFILES)}")
+    return profile
+
+
+def iter_page_texts(file, pages=None, profile=DEFAULT_PROFILE):
+    """Yield a PageText for each PDF page as soon as it is decoded.
+
+    `file` is a path or binary stream; `pages` optionally limits reading to
+    those 1-based page numbers, and `profile` picks the page reader. The
+    document is opened once and every page visited once; each page's cache
+    is flushed before the next one is read, so memory stays flat however
+    long the document is.
+    """
+    reader, open_args = PROFILES[check_profile(profile)]
+    try:
+        with pdfplumber.open(file, pages=pages, **open_args) as pdf:
+            for page in pdf.pages:
+                number = page.page_number
+                try:
+                    page_text, strategy = reader(page)
+                except Exception as e:
+                    print(f"Error extracting text from page: {e}")
+                    page_text, strategy = "", ERROR
+                finally:
+                    _release(page)
+                yield PageText(number, page_text, strategy)
+    except Exception as e:
+        raise Exception(f"PDF extraction error: {str(e)}")
+
+
+def _reopenable(file):
+    """A path or the document's bytes: something each pool worker can open by itself"""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if hasattr(file, 'getvalue'):
+        return file.getvalue()
+    if hasattr(file, 'read'):
+        file.seek(0)
+        return file.read()
+    return os.fspath(file)
+
+
+def _open_arg(file):
+    return io.BytesIO(file) if isinstance(file, bytes) else file
+
+
+def page_ranges(count, chunks):
+    """Split pages 1..count into at most `chunks` contiguous, near-equal ranges"""
+    chunks = max(1, min(chunks, count))
+    size, extra = divmod(count, chunks)
+    ranges = []
+    first = 1
+    for index in range(chunks):
+        last = first + size + (1 if index < extra else 0)
+        ranges.append(list(range(first, last)))
+        first = last
+    return ranges
+
+
+def _read_range(task):
+    file, pages, profile = task
+    return list(iter_page_texts(_open_arg(file), pages, profile))
+
+
+class PagePool:
+    """Worker processes for read_page_texts, started on first use and kept until close()
+
+    One pool serves every document read with it, so the processes are
+    started once rather than per file. Usable as a context manager.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._pool = None
+
+    def imap(self, func, tasks):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        return self._pool.imap(func, tasks)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_page_texts(file, workers=1, min_pages=PARALLEL_MIN_PAGES, profile=DEFAULT_PROFILE, pool=None):
+    """PageTexts for every page, in order, decoded across `workers` processes.
+
+    Documents shorter than `min_pages` pages, and calls made from a pool
+    worker (which may not start processes of its own), are read serially.
+    Otherwise the page numbers are split into contiguous ranges and each
+    worker opens the document itself and decodes its ranges. Pass a
+    PagePool to reuse its processes across documents; without one a pool
+    is started for this call only.
+    """
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return list(iter_page_texts(file, profile=profile))
+    file = _reopenable(file)
+    try:
+        with pdfplumber.open(_open_arg(file)) as pdf:
+            count = len(pdf.pages)
+    except Exception as e:
+        raise Exception(f"PDF extraction error: {str(e)}")
+    if count < min_pages:
+        return list(iter_page_texts(_open_arg(file), profile=profile))
+
+    # Two ranges per worker evens out pages that are much slower than others
+    ranges = page_ranges(count, workers * 2)
+    tasks = [(file, pages, profile) for pages in ranges]
+    if pool is not None:
+        return [page for chunk in pool.imap(_read_range, tasks) for page in chunk]
+    with PagePool(min(workers, len(ranges))) as pool:
+        return [page for chunk in pool.imap(_read_range, tasks) for page in chunk]
+
+
+def iter_pages(file, profile=DEFAULT_PROFILE):
+    """Yield the text of each PDF page as soon as it is decoded"""
+    for page in iter_page_texts(file, profile=profile):
+        yield page.text
+
+
+def join_pages(pages):
+    """Join page texts the way extract_text_from_pdf always has: one newline after each non-empty page"""
+    return "".join(page_text + "\n" for page_text in pages if page_text)
@@ -0,0 +1,323 @@
+"""Streaming text readers for the formats in formats.MIME_TYPES.
+
+Importing this module registers them. Each reader takes a path or a
+binary stream and returns the document's text, one line per paragraph.
+"""
+import codecs
+import contextlib
+import re
+import zipfile
+from html.parser import HTMLParser
+from xml.etree.ElementTree import iterparse
+
+import docx_extract
+import pdf_extract
+from formats import DOCX, HTML, MARKDOWN, MIME_TYPES, ODT, PDF, RTF, TXT, register_reader
+
+CHUNK_SIZE = 64 * 1024
+
+
+@contextlib.contextmanager
+def _binary(file):
+    if hasattr(file, 'read'):
+        yield file
+    else:
+        with open(file, 'rb') as f:
+            yield f
+
+
+def sniff_encoding(head):
+    """Encoding of a text file from its first bytes: BOM, else UTF-8, else Windows-1252"""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off by the end of the sample is still UTF-8
+        if e.start < len(head) - 3:
+            return 'cp1252'
+    return 'utf-8'
+
+
+def iter_text_chunks(file):
+    """Decoded text of a file, CHUNK_SIZE bytes at a time"""
+    with _binary(file) as f:
+        head = f.read(CHUNK_SIZE)
+        decoder = codecs.getincrementaldecoder(sniff_encoding(head))(errors='replace')
+        chunk = head
+        while chunk:
+            yield decoder.decode(chunk)
+            chunk = f.read(CHUNK_SIZE)
+        yield decoder.decode(b'', final=True)
+
+
+def iter_lines(file):
+    """Lines of a text file without their line endings, whatever the newline convention"""
+    pending = ''
+    after_cr = False
+    for chunk in iter_text_chunks(file):
+        if not chunk:
+            continue
+        # A "\r\n" split between two chunks is one line break
+        if after_cr and chunk.startswith('\n'):
+            chunk = chunk[1:]
+        after_cr = chunk.endswith('\r')
+        pending += chunk
+        lines = pending.splitlines()
+        # The last line may continue in the next chunk
+        pending = lines.pop() if lines and not pending.endswith(('\n', '\r')) else ''
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _join_lines(lines):
+    return "".join(line + "\n" for line in lines)
+
+
+@register_reader(MIME_TYPES[TXT])
+def read_txt(file):
+    return _join_lines(iter_lines(file))
+
+
+_MD_FENCE_RE = re.compile(r'^\s*(```|~~~)')
+_MD_RULE_RE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+_MD_HEADING_RE = re.compile(r'^\s{0,3}#{1,6}\s+|\s+#+\s*$')
+_MD_QUOTE_RE = re.compile(r'^\s*(>\s?)+')
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\([^)]*\)')
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\(([^)\s]*)[^)]*\)')
+_MD_AUTOLINK_RE = re.compile(r'<((?:https?://|mailto:)[^>]+)>')
+_MD_EMPHASIS_RE = re.compile(r'(\*\*|__|\*|_|~~|`)(?=\S)(.+?)(?<=\S)\1')
+_MD_TABLE_RULE_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+
+
+def markdown_line(line):
+    """A Markdown line as plain text: markup removed, link targets kept beside their text"""
+    if _MD_RULE_RE.match(line) or _MD_TABLE_RULE_RE.match(line):
+        return ''
+    line = _MD_QUOTE_RE.sub('', line)
+    line = _MD_HEADING_RE.sub('', line)
+    line = _MD_IMAGE_RE.sub(r'\1', line)
+    # Keep the URL: "[LinkedIn](https://linkedin.com/in/x)" is contact information
+    line = _MD_LINK_RE.sub(lambda m: f"{m.group(1)} {m.group(2)}" if m.group(2) else m.group(1), line)
+    line = _MD_AUTOLINK_RE.sub(r'\1', line)
+    line = _MD_EMPHASIS_RE.sub(r'\2', line)
+    if line.strip().startswith('|'):
+        line = ' '.join(cell.strip() for cell in line.strip().strip('|').split('|'))
+    return line
+
+
+@register_reader(MIME_TYPES[MARKDOWN])
+def read_markdown(file):
+    lines = []
+    for line in iter_lines(file):
+        # Fence lines go; the code between them is kept as written
+        if not _MD_FENCE_RE.match(line):
+            lines.append(markdown_line(line))
+    return _join_lines(lines)
+
+
+class _HTMLText(HTMLParser):
+    # Tags that end a line of text, and tags whose content is never text
+    BLOCK_TAGS = {'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+                  'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+                  'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul'}
+    CELL_TAGS = {'td', 'th'}
+    SKIP_TAGS = {'head', 'script', 'style', 'template', 'noscript', 'svg'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+        elif tag in self.CELL_TAGS:
+            self.parts.append(' ')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip = max(0, self.skip - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+    def text(self):
+        lines = (' '.join(line.split()) for line in ''.join(self.parts).split('\n'))
+        return _join_lines(line for line in lines if line)
+
+
+@register_reader(MIME_TYPES[HTML])
+def read_html(file):
+    parser = _HTMLText()
+    for chunk in iter_text_chunks(file):
+        parser.feed(chunk)
+    parser.close()
+    return parser.text()
+
+
+# Control words that produce text, and groups whose content is never text
+_RTF_CHARS = {
+    'par': '\n', 'line': '\n', 'sect': '\n', 'page': '\n', 'row': '\n', 'cell': ' ', 'tab': '\t',
+    'emdash': '\u2014', 'endash': '\u2013', 'bullet': '\u2022', 'lquote': '\u2018', 'rquote': '\u2019',
+    'ldblquote': '\u201c', 'rdblquote': '\u201d', 'emspace': ' ', 'enspace': ' ', 'qmspace': ' ',
+}
+_RTF_SKIP_DESTINATIONS = {
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'themedata', 'colorschememapping',
+    'latentstyles', 'datastore', 'xmlnstbl', 'listtable', 'listoverridetable', 'rsidtbl', 'filetbl',
+    'revtbl', 'generator', 'fldinst', 'bkmkstart', 'bkmkend', 'pgdsctbl', 'mmathPr',
+}
+_RTF_TOKEN_RE = re.compile(
+    r"\\([a-zA-Z]+)(-?\d+)? ?"    # control word with optional parameter
+    r"|\\'([0-9a-fA-F]{2})"       # hex-escaped byte in the document code page
+    r"|\\([^a-zA-Z])"             # control symbol
+    r"|([{}])"                    # group
+    r"|[\r\n]+"                   # source line breaks are not text
+    r"|([^\\{}\r\n]+)"            # plain text
+)
+
+
+def rtf_to_text(rtf):
+    """Plain text of an RTF document.
+
+    One linear pass over the tokens with a stack of group states; groups
+    that hold fonts, styles, pictures or field instructions are skipped,
+    and \\u escapes skip their ANSI fallback characters.
+    """
+    encoding = 'cp1252'
+    stack = []
+    skip = False       # inside a group that holds no text
+    uc_skip = 1        # fallback characters after each \uN
+    pending_skip = 0   # fallback characters still to drop
+    out = []
+    for match in _RTF_TOKEN_RE.finditer(rtf):
+        word, param, hex_byte, symbol, brace, text = match.groups()
+        if brace == '{':
+            stack.append((skip, uc_skip))
+            pending_skip = 0
+        elif brace == '}':
+            if stack:
+                skip, uc_skip = stack.pop()
+            pending_skip = 0
+        elif word:
+            if word == 'ansicpg' and param:
+                encoding = f'cp{param}'
+            elif word == 'uc' and param:
+                uc_skip = int(param)
+            elif word in _RTF_SKIP_DESTINATIONS:
+                skip = True
+            elif skip:
+                continue
+            elif word == 'u' and param:
+                out.append(chr(int(param) % 0x10000))
+                pending_skip = uc_skip
+            elif word in _RTF_CHARS:
+                out.append(_RTF_CHARS[word])
+                pending_skip = 0
+        elif symbol:
+            if symbol == '*':
+                # {\*\dest ...}: an optional destination this reader doesn't know
+                skip = True
+            elif skip:
+                continue
+            elif pending_skip:
+                pending_skip -= 1
+            elif symbol in '\\{}':
+                out.append(symbol)
+            elif symbol == '~':
+                out.append('\u00a0')
+            elif symbol in '-_':
+                out.append('-' if symbol == '_' else '')
+        elif hex_byte:
+            if skip:
+                continue
+            if pending_skip:
+                pending_skip -= 1
+                continue
+            try:
+                out.append(bytes([int(hex_byte, 16)]).decode(encoding))
+            except (LookupError, UnicodeDecodeError):
+                out.append(bytes([int(hex_byte, 16)]).decode('cp1252', errors='replace'))
+        elif text:
+            if skip:
+                continue
+            if pending_skip:
+                dropped = min(pending_skip, len(text))
+                text = text[dropped:]
+                pending_skip -= dropped
+            out.append(text)
+    return _join_lines(line.strip() for line in ''.join(out).split('\n') if line.strip())
+
+
+@register_reader(MIME_TYPES[RTF])
+def read_rtf(file):
+    # RTF is 7-bit text; anything beyond ASCII is escaped, so latin-1 decodes it losslessly
+    with _binary(file) as f:
+        return rtf_to_text(f.read().decode('latin-1'))
+
+
+ODF_TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+ODF_OFFICE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}'
+_ODF_PARAGRAPHS = (ODF_TEXT + 'p', ODF_TEXT + 'h')
+_ODF_SKIP = (ODF_OFFICE + 'annotation', ODF_TEXT + 'note-citation', ODF_TEXT + 'tracked-changes')
+
+
+def _odf_text(elem, parts):
+    """Text of an ODF paragraph, leaving out nested paragraphs (text boxes), which are read on their own"""
+    if elem.text:
+        parts.append(elem.text)
+    for child in elem:
+        tag = child.tag
+        if tag == ODF_TEXT + 's':
+            parts.append(' ' * int(child.get(ODF_TEXT + 'c', 1)))
+        elif tag == ODF_TEXT + 'tab':
+            parts.append('\t')
+        elif tag == ODF_TEXT + 'line-break':
+            parts.append('\n')
+        elif tag not in _ODF_PARAGRAPHS and tag not in _ODF_SKIP:
+            _odf_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    return parts
+
+
+def iter_odt_paragraphs(file):
+    """Yield the text of each non-empty paragraph or heading in an ODT's content.xml, in document order"""
+    with zipfile.ZipFile(file) as archive, archive.open('content.xml') as content:
+        skip = 0
+        for event, elem in iterparse(content, events=('start', 'end')):
+            if elem.tag in _ODF_SKIP:
+                skip += 1 if event == 'start' else -1
+            elif event == 'end' and not skip and elem.tag in _ODF_PARAGRAPHS:
+                text = ''.join(_odf_text(elem, []))
+                # Keep the tail: it is the parent's text that follows this paragraph
+                tail = elem.tail
+                elem.clear()
+                elem.tail = tail
+                if text.strip():
+                    yield text
+
+
+@register_reader(MIME_TYPES[ODT])
+def read_odt(file):
+    try:
+        return _join_lines(iter_odt_paragraphs(file))
+    except Exception as e:
+        raise Exception(f"ODT extraction error: {str(e)}")
+
+
+# PDF and DOCX with default settings; ResumeParser uses its own profile and workers for PDFs
+register_reader(MIME_TYPES[PDF], lambda file: pdf_extract.join_pages(pdf_extract.iter_pages(file)))
+register_reader(MIME_TYPES[DOCX], docx_extract.extract_text)
@@ -0,0 +1,24 @@
+# Keys of a full parse result, besides 'success'. Kept apart from
+# resume_parser so the CLI can validate --fields without loading it.
+RESULT_FIELDS = ('name', 'contact_info', 'skills', 'education', 'experience', 'text_length', 'raw_text')
+
+
+def check_fields(fields):
+    """`fields` as a tuple in RESULT_FIELDS order; None means all of them"""
+    if fields is None:
+        return RESULT_FIELDS
+    fields = set(fields)
+    unknown = fields.difference(RESULT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. "
+                         f"Choose from: {', '.join(RESULT_FIELDS)}")
+    return tuple(field for field in RESULT_FIELDS if field in fields)
+
+
+def select_result(result, fields):
+    """Just the given fields of a full parse result, plus 'success'"""
+    if not result.get('success'):
+        return result
+    selected = {field: result[field] for field in fields if field in result}
+    selected['success'] = result['success']
+    return selected
@@ -1,210 +1,422 @@
-import spacy
-import pdfplumber
-import re
-from docx import Document
-import nltk
+import functools
+import multiprocessing
 import os
-import subprocess
-import sys
+import re
+import time
+
+from cache import ResultCache, TextCache, content_hash, result_key, text_key
+import contacts
+from experience import best_years, find_years
+from formats import DOCX, PDF, as_source, reader_for
+from metrics import NULL_RECORDER, MetricsBuffer, StageRecorder, replay
+from model_registry import DEFAULT_SPACY_MODEL, ModelRegistry, get_registry
+import docx_extract
+import names
+import normalizer
+import pdf_extract
+import readers  # registers the TXT, RTF, ODT, HTML and Markdown readers
+from result_fields import RESULT_FIELDS, check_fields, select_result
+import sections
+from taxonomy import DEFAULT_SKILLS_PATH, SkillTaxonomy
+from timeline import build_timeline
+
+# Part of every result cache key; bump whenever extraction output changes
+PARSER_VERSION = "17"
+
+# Part of every text cache key; bump whenever extract_text output changes
+EXTRACTOR_VERSION = "6"
+
+# Only this much of the resume is searched for the candidate's name
+NAME_SEARCH_CHARS = 1000
+
+# Without a detected header, contact details are looked for here first
+CONTACT_SEARCH_CHARS = 3000
 
-# Install spaCy model if not available
-try:
-    import spacy
-    spacy.load("en_core_web_sm")
-except (ImportError, OSError):
-    print("Downloading spaCy model...")
-    subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
+# spaCy pipes each extractor reads; only their union is loaded
+EXTRACTOR_COMPONENTS = {
+    'name': ('ner',),
+    'contact_info': (),
+    'skills': (),
+    'education': (),
+    'experience': ('ner',),
+}
 
-# Download NLTK data with error handling
-try:
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt', quiet=True)
-except Exception as e:
-    print(f"NLTK download warning: {e}")
+# Resume sections each extractor reads (see sections.py); None means the
+# whole document, which is also the fallback when no section is found
+EXTRACTOR_SECTIONS = {
+    'name': ('header',),
+    'contact_info': ('header',),
+    'skills': None,
+    'education': ('education',),
+    'experience': ('summary', 'experience'),
+}
 
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+# A date range labelled like this is a period of study, not a job. Only
+# degree words: a job can be at a university, and "MA" is also a US state
+DEGREE_RE = re.compile(r"(?<!\w)(?:bachelor|master'?s|masters? of|ph\.?\s?d|mba|b\.?sc|m\.?sc|b\.s|m\.s"
+                       r"|b\.a|m\.a|b\.?\s?tech|m\.?\s?tech|degree|diploma|graduated)(?!\w)", re.IGNORECASE)
+
+# Analysis stages and the stages each is computed from, in dependency order
+STAGE_REQUIRES = {
+    'text': (),
+    'normalized_text': ('text',),
+    'sections': ('text',),
+    'doc': ('normalized_text',),
+}
+
+# Stages each result field may read. A stage no requested field needs is
+# never computed; the name only reaches 'doc' when the header heuristic is unsure
+FIELD_STAGES = {
+    'name': ('normalized_text', 'sections', 'doc'),
+    'contact_info': ('normalized_text', 'sections'),
+    'skills': ('normalized_text',),
+    'education': ('normalized_text', 'sections'),
+    'experience': ('normalized_text', 'sections', 'doc'),
+    'text_length': ('normalized_text',),
+    'raw_text': ('normalized_text',),
+}
+
+def required_stages(fields=None):
+    """Stages the given result fields need, with everything they are computed from"""
+    needed = set()
+    pending = [stage for field in check_fields(fields) for stage in FIELD_STAGES[field]]
+    while pending:
+        stage = pending.pop()
+        if stage not in needed:
+            needed.add(stage)
+            pending.extend(STAGE_REQUIRES[stage])
+    return tuple(stage for stage in STAGE_REQUIRES if stage in needed)
+
+# Fields found in a resume's header, which parse_resume reads from page 1 alone
+HEADER_FIELDS = frozenset({'name', 'contact_info'})
+
+class AnalysisContext:
+    """Per-resume state shared by every extractor.
+    
+    The spaCy Doc is computed once, on first access, so extract_name and
+    extract_experience read the same entities instead of each running the
+    pipeline. Sections are detected from the raw line structure; an
+    extractor reading a section gets a Doc of just that slice.
+    
+    With `stages` (see required_stages), reaching a stage outside them is
+    an error, so FIELD_STAGES can't silently understate what a field costs.
+    """
+    
+    def __init__(self, parser, text, raw_text=None, stages=None):
+        self.parser = parser
+        self.text = text or ""
+        # Text as extracted, before normalization
+        self.raw_text = raw_text if raw_text is not None else self.text
+        self.stages = None if stages is None else frozenset(stages)
+        self._doc = None
+        self._offsets = None
+        self._sections = None
+        self._section_texts = {}
+        self._section_docs = {}
+    
+    def _require(self, stage):
+        if self.stages is not None and stage not in self.stages:
+            raise RuntimeError(f"Stage '{stage}' is not among the requested stages: "
+                               f"{', '.join(sorted(self.stages))}")
+    
+    @property
+    def doc(self):
+        if self._doc is None:
+            self._require('doc')
+            self._doc = self.parser.nlp(self.text)
+        return self._doc
+    
+    @property
+    def sections(self):
+        """{section: raw text} found in the raw text, detected on first access"""
+        if self._sections is None:
+            self._require('sections')
+            self._sections = sections.segment(self.raw_text)
+        return self._sections
+    
+    def section_text(self, names):
+        """Normalized text of the named sections, or the whole text if none were found.
+        
+        Lines are normalized one by one so the section keeps its line breaks.
+        """
+        if names is None:
+            return self.text
+        names = tuple(names)
+        if names not in self._section_texts:
+            found = [self.sections[name] for name in names if name in self.sections]
+            lines = []
+            for raw in found:
+                for line in raw.splitlines():
+                    line = self.parser.preprocess_text(line)
+                    if line:
+                        lines.append(line)
+            self._section_texts[names] = '\n'.join(lines) if lines else self.text
+        return self._section_texts[names]
+    
+    def lines_text(self, exclude=()):
+        """Normalized text of the whole resume, line by line, without the named sections"""
+        exclude = tuple(exclude)
+        key = ('lines',) + exclude
+        if key not in self._section_texts:
+            raw = self.raw_text
+            if exclude and self.sections:
+                raw = '\n'.join(text for name, text in self.sections.items() if name not in exclude)
+            lines = (self.parser.preprocess_text(line) for line in raw.splitlines())
+            self._section_texts[key] = '\n'.join(line for line in lines if line)
+        return self._section_texts[key]
+    
+    def doc_for(self, names):
+        """spaCy Doc of the named sections, sharing the whole-text Doc on fallback"""
+        text = self.section_text(names)
+        if text is self.text:
+            return self.doc
+        names = tuple(names)
+        if names not in self._section_docs:
+            self._require('doc')
+            self._section_docs[names] = self.parser.nlp(text)
+        return self._section_docs[names]
+    
+    @property
+    def offsets(self):
+        """OffsetMap from self.text back into self.raw_text, built on first access"""
+        if self._offsets is None:
+            self._offsets = normalizer.normalize(self.raw_text)[1]
+        return self._offsets
+    
+    @property
+    def has_doc(self):
+        return self._doc is not None
+    
+    def entities(self, label, end=None, sections=None):
+        """Entities with the given label, optionally only those ending before `end`"""
+        doc = self.doc_for(sections) if sections is not None else self.doc
+        return [ent for ent in doc.ents
+                if ent.label_ == label and (end is None or ent.end_char <= end)]
 
 class ResumeParser:
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # If model not found, download it
-            os.system("python3 -m spacy download en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+    extractor_components = EXTRACTOR_COMPONENTS
+    extractor_sections = EXTRACTOR_SECTIONS
+    
+    def __init__(self, offline=None, registry=None, model_name=DEFAULT_SPACY_MODEL,
+                 skills_path=DEFAULT_SKILLS_PATH, timings=False, track_memory=False, metrics=None,
+                 cache=None, text_cache=None, pdf_workers=1, pdf_profile=pdf_extract.DEFAULT_PROFILE):
+        # Models are loaded lazily through the registry on first use, so
+        # constructing a parser is cheap and never touches the network
+        if registry is None:
+            registry = ModelRegistry(offline=offline) if offline is not None else get_registry()
+        self.registry = registry
+        self.model_name = model_name
         
-        # Initialize stopwords with fallback
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except LookupError:
-            # If stopwords still not available, use a basic set
-            self.stop_words = {'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
-                             "you're", "you've", "you'll", "you'd", 'your', 'yours', 'yourself', 
-                             'yourselves', 'he', 'him', 'his', 'himself', 'she', "she's", 'her', 
-                             'hers', 'herself', 'it', "it's", 'its', 'itself', 'they', 'them', 
-                             'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 
-                             'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are', 
-                             'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 
-                             'do', 'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 
-                             'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for', 
-                             'with', 'about', 'against', 'between', 'into', 'through', 'during', 
-                             'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in', 
-                             'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 
-                             'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'any', 
-                             'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 
-                             'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 
-                             's', 't', 'can', 'will', 'just', 'don', "don't", 'should', "should've", 
-                             'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', "aren't", 
-                             'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't", 'hadn', 
-                             "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn', "isn't", 'ma', 
-                             'mightn', "mightn't", 'mustn', "mustn't", 'needn', "needn't", 'shan', 
-                             "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't", 
-                             'won', "won't", 'wouldn', "wouldn't"}
-        
-        # Enhanced skills database
-        self.skills_db = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust', 'swift', 'kotlin'],
-            'web_development': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'express'],
-            'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'cassandra'],
-            'devops': ['docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp', 'ci/cd', 'terraform', 'ansible'],
-            'data_science': ['machine learning', 'deep learning', 'nlp', 'computer vision', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn'],
-            'tools': ['git', 'jira', 'confluence', 'linux', 'bash', 'powershell']
-        }
+        # Skills taxonomy, reloaded from disk whenever the file changes
+        self.taxonomy = SkillTaxonomy(skills_path)
         
+        # Per-stage instrumentation; costs one no-op call per stage when off
+        self.timings = timings
+        self.track_memory = track_memory
+        self.metrics = metrics
+        
+        # Optional ResultCache consulted by parse_resume before any extraction,
+        # and TextCache that lets re-analysis skip PDF/DOCX decoding
+        self.cache = cache
+        self.text_cache = text_cache
+        
+        # How often extract_name was settled by the header heuristic vs NER
+        self.name_stats = {'header': 0, 'ner': 0, 'not_found': 0}
+        
+        # Processes used to decode the pages of long PDFs; 1 reads serially.
+        # They are started on the first long PDF and reused until close()
+        self.pdf_workers = pdf_workers
+        self._pdf_pool = pdf_extract.PagePool(pdf_workers) if pdf_workers > 1 else None
+        # 'fast', 'balanced', 'accurate' or 'legacy' PDF page reading (see pdf_extract.PROFILES)
+        self.pdf_profile = pdf_extract.check_profile(pdf_profile)
+        
+    def close(self):
+        """Stop the PDF page workers, if any were started"""
+        if self._pdf_pool is not None:
+            self._pdf_pool.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def skills_db(self):
+        """Category -> skills mapping of the current taxonomy"""
+        return self.taxonomy.current().skills_db
+    
+    @skills_db.setter
+    def skills_db(self, skills_db):
+        self.taxonomy = SkillTaxonomy.from_dict(skills_db)
+    
+    @property
+    def skill_matcher(self):
+        """Compiled matcher of the current taxonomy"""
+        return self.taxonomy.current().matcher
+    
+    def required_components(self):
+        """Union of the spaCy pipes the extractors declare they need"""
+        components = set()
+        for needed in self.extractor_components.values():
+            components.update(needed)
+        return tuple(sorted(components))
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline pruned to the required components, loaded on first access"""
+        return self.registry.get_nlp(self.model_name, self.required_components())
+    
+    def pipeline_report(self):
+        """Pipes kept in the loaded pipeline and how long loading took"""
+        report = {'model': self.model_name, 'components': list(self.required_components())}
+        nlp = self.nlp
+        report['pipes'] = list(nlp.pipe_names)
+        report['load'] = self.registry.report()['resources']
+        return report
+    
+    @property
+    def stop_words(self):
+        """Stopword set, loaded on first access"""
+        return self.registry.get_stop_words()
+    
+    def analyze(self, text, raw_text=None, stages=None):
+        """Create the shared analysis context for a piece of resume text"""
+        return AnalysisContext(self, text, raw_text, stages)
+    
+    def _context(self, text_or_context):
+        if isinstance(text_or_context, AnalysisContext):
+            return text_or_context
+        return self.analyze(text_or_context)
+    
     def extract_text_from_pdf(self, file_path):
         """Extract text from PDF file with better error handling"""
-        text = ""
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    try:
-                        # Try multiple extraction methods
-                        page_text = page.extract_text()
-                        if not page_text:
-                            # Try alternative extraction
-                            page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
-                        if page_text:
-                            text += page_text + "\n"
-                    except Exception as e:
-                        print(f"Error extracting text from page: {e}")
-                        continue
-                        
-            # If still no text, try extracting tables
-            if not text.strip():
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        tables = page.extract_tables()
-                        for table in tables:
-                            for row in table:
-                                if row:
-                                    text += ' '.join([str(cell) for cell in row if cell]) + "\n"
-                                    
-        except Exception as e:
-            raise Exception(f"PDF extraction error: {str(e)}")
-        
-        return text
+        pages = []
+        for page in pdf_extract.read_page_texts(file_path, self.pdf_workers,
+                                                    profile=self.pdf_profile, pool=self._pdf_pool):
+            if self.metrics is not None:
+                self.metrics.count('pdf_pages', strategy=page.strategy)
+            pages.append(page.text)
+        return pdf_extract.join_pages(pages)
+    
+    def page_report(self, file_path):
+        """Which strategy produced each PDF page's text, and how much text it gave"""
+        return [{'page': page.number, 'strategy': page.strategy, 'chars': len(page.text)}
+                for page in pdf_extract.iter_page_texts(as_source(file_path).open(),
+                                                         profile=self.pdf_profile)]
     
     def extract_text_from_docx(self, file_path):
         """Extract text from DOCX file with better extraction"""
-        try:
-            doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text:
-                            text += cell.text + "\n"
-                            
-            return text
-        except Exception as e:
-            raise Exception(f"DOCX extraction error: {str(e)}")
+        return docx_extract.extract_text(file_path)
     
     def extract_text(self, file_path):
-        """Extract text based on file type"""
-        if file_path.endswith('.pdf'):
-            return self.extract_text_from_pdf(file_path)
-        elif file_path.endswith('.docx'):
-            return self.extract_text_from_docx(file_path)
+        """Extract text based on file type
+        
+        `file_path` may also be bytes, a memoryview or a binary stream; the
+        format is detected from magic bytes, falling back to the extension.
+        PDF and DOCX use the parser's own settings; every other format goes
+        to the reader registered for its MIME type (see readers.py).
+        """
+        source = as_source(file_path)
+        if source.format == PDF:
+            return self.extract_text_from_pdf(source.open())
+        elif source.format == DOCX:
+            return self.extract_text_from_docx(source.open())
+        reader = reader_for(source.mime_type)
+        if reader is None:
+            raise ValueError("Unsupported file format. Please upload PDF, DOCX, TXT, RTF, ODT, HTML or Markdown.")
+        return reader(source.open())
+    
+    def iter_pages(self, file_path):
+        """Yield the resume's text page by page as it is decoded
+        
+        Lets callers work on page 1 (contact details, the name) before the
+        rest of a long PDF has been read. Other formats have no pages and
+        are yielded whole.
+        """
+        source = as_source(file_path)
+        if source.format == PDF:
+            yield from pdf_extract.iter_pages(source.open(), self.pdf_profile)
         else:
-            raise ValueError("Unsupported file format. Please upload PDF or DOCX.")
+            yield self.extract_text(source)
     
     def preprocess_text(self, text):
         """Clean and preprocess the text"""
         if not text:
             return ""
             
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.@-]', '', text)
-        return text.strip()
+        # Collapse whitespace and drop stray symbols in one pass, keeping
+        # technical tokens (c++, c#, ci/cd) and URLs intact
+        return normalizer.clean(text)
     
     def extract_contact_info(self, text):
-        """Extract contact information"""
-        contact_info = {}
-        
-        # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        contact_info['email'] = emails[0] if emails else "Not found"
-        
-        # Phone numbers
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        contact_info['phone'] = phones[0] if phones else "Not found"
-        
-        # LinkedIn
-        linkedin_pattern = r'(https?://)?(www\.)?linkedin\.com/(in|company)/[a-zA-Z0-9-]+'
-        linkedin_matches = re.findall(linkedin_pattern, text)
-        if linkedin_matches:
-            contact_info['linkedin'] = ''.join(linkedin_matches[0])
-        else:
-            contact_info['linkedin'] = "Not found"
+        """Extract contact information
+        
+        One scan over the header (or, without sections, the first
+        CONTACT_SEARCH_CHARS characters) that stops once email, phone and
+        LinkedIn are all found; only fields still missing are looked for in
+        the rest of the document. Phones are E.164, LinkedIn URLs canonical.
+        """
+        context = self._context(text)
+        region = context.section_text(self.extractor_sections['contact_info'])
+        if region is context.text:
+            region = region[:CONTACT_SEARCH_CHARS]
+        found = contacts.scan(region)
+        if len(found) < len(contacts.FIELDS) and len(region) < len(context.text):
+            contacts.scan(context.text, found)
         
-        return contact_info
+        return {field: found.get(field, "Not found") for field in contacts.FIELDS}
     
     def extract_name(self, text):
-        """Extract candidate name using NER"""
-        if not text:
+        """Extract candidate name: header-line heuristic first, NER when unsure"""
+        context = self._context(text)
+        if not context.text:
             return "Not found"
-            
-        doc = self.nlp(text[:1000])  # Process first 1000 characters for efficiency
-        names = []
         
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                # Filter out common false positives
-                if len(ent.text.split()) >= 2 and len(ent.text) > 3:
-                    names.append(ent.text)
+        # The first lines of the raw text usually are the name; trust them
+        # when the heuristic is confident and never run spaCy
+        name, confidence = names.header_name(context.raw_text)
+        if confidence >= names.CONFIDENT:
+            self._count_name_tier('header')
+            return name
+        
+        name = self.extract_name_ner(context)
+        self._count_name_tier('not_found' if name == "Not found" else 'ner')
+        return name
+    
+    def extract_name_ner(self, text):
+        """Extract candidate name using NER"""
+        context = self._context(text)
+        candidates = []
+        
+        # Only the top of the resume is considered
+        for ent in context.entities("PERSON", end=NAME_SEARCH_CHARS,
+                                    sections=self.extractor_sections['name']):
+            # Filter out common false positives
+            if len(ent.text.split()) >= 2 and len(ent.text) > 3:
+                candidates.append(ent.text)
         
-        return names[0] if names else "Not found"
+        return candidates[0] if candidates else "Not found"
+    
+    def _count_name_tier(self, tier):
+        self.name_stats[tier] += 1
+        if self.metrics is not None:
+            self.metrics.count('name_tier', tier=tier)
     
     def extract_skills(self, text):
         """Extract skills using comprehensive skill database"""
+        text = self._context(text).section_text(self.extractor_sections['skills'])
         if not text:
             return {}
             
-        text_lower = text.lower()
-        skills_found = {}
-        
-        for category, skills in self.skills_db.items():
-            category_skills = []
-            for skill in skills:
-                # Check for exact matches and variations
-                if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-                    category_skills.append(skill)
-            if category_skills:
-                skills_found[category] = category_skills
-                
-        return skills_found
+        return self.skill_matcher.match(text)
     
     def extract_education(self, text):
         """Extract education information"""
-        if not text:
+        context = self._context(text)
+        if not context.text:
             return []
+        text = context.section_text(self.extractor_sections['education'])
             
         education_keywords = [
             'bachelor', 'master', 'phd', 'mba', 'bs', 'ms', 'b.tech', 'm.tech',
@@ -212,7 +424,8 @@ class ResumeParser:
             'degree', 'graduated', 'diploma'
         ]
         
-        sentences = text.split('.')
+        # Section text keeps its line breaks, and each line is usually one entry
+        sentences = re.split(r'[.\n]', text)
         education_info = []
         
         for sentence in sentences:
@@ -227,66 +440,295 @@ class ResumeParser:
     
     def extract_experience(self, text):
         """Extract work experience information"""
-        if not text:
-            return {'years': "Not specified", 'companies': []}
+        context = self._context(text)
+        if not context.text:
+            return {'years': "Not specified", 'companies': [], 'timeline': build_timeline(""), 'years_mentions': []}
+        text = context.section_text(self.extractor_sections['experience'])
             
-        experience_patterns = [
-            r'(\d+)\s*years?\s*of?\s*experience',
-            r'experience.*(\d+)\s*years?',
-            r'worked\s*for\s*(\d+)\s*years?',
-            r'(\d+)\+?\s*years?\s*in',
-            r'(\d+)\+?\s*years?\s*professional'
-        ]
-        
         experience = {'years': "Not specified", 'companies': []}
         
-        # Find years of experience
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                experience['years'] = f"{matches[0]} years"
-                break
+        # Find years of experience: every mention in one pass, best first
+        mentions = find_years(text)
+        best = best_years(mentions)
+        # Job date ranges, merged so overlapping roles count once. Without an
+        # experience section, read the whole resume with its line breaks, so
+        # a role's label is its own line, and leave study periods out
+        if text is context.text:
+            experience['timeline'] = build_timeline(context.lines_text(exclude=('education',)),
+                                                    exclude=DEGREE_RE)
+        else:
+            experience['timeline'] = build_timeline(text)
+        if best is not None:
+            experience['years'] = f"{best.years} years"
+        elif experience['timeline']['total_months']:
+            experience['years'] = f"{experience['timeline']['total_years']:g} years"
+        experience['years_mentions'] = [mention._asdict() for mention in mentions]
         
         # Extract potential company names using NER
-        doc = self.nlp(text)
         companies = []
-        for ent in doc.ents:
-            if ent.label_ == "ORG" and len(ent.text) > 3:
+        for ent in context.entities("ORG", sections=self.extractor_sections['experience']):
+            if len(ent.text) > 3:
                 companies.append(ent.text)
         
         experience['companies'] = list(set(companies))[:5]  # Remove duplicates and limit to 5
         
         return experience
     
-    def parse_resume(self, file_path):
-        """Main method to parse resume"""
+    def parse_resume(self, file_path, timings=None, fields=None):
+        """Main method to parse resume
+        
+        `file_path` can be a path, bytes, a memoryview or a binary stream,
+        so uploads can be parsed without a temporary file.
+        
+        `fields` limits the result to some of RESULT_FIELDS, and only the
+        extractors and stages (see FIELD_STAGES) those fields need are run:
+        ['contact_info', 'skills'] never runs spaCy, and name and contact
+        details alone are read from page 1 of a PDF when they are found there.
+        A cached full result serves any selection.
+        
+        With `timings` (default: the parser's setting) the result gets a
+        'timings' block with wall time, CPU time and, if track_memory is on,
+        peak allocation for every stage. Stage timings also go to the
+        metrics sink when one is configured.
+        """
+        timings = self.timings if timings is None else timings
+        partial = fields is not None
+        fields = check_fields(fields)
+        if timings or self.metrics is not None:
+            recorder = StageRecorder(track_memory=self.track_memory)
+        else:
+            recorder = NULL_RECORDER
         try:
-            # Extract text based on file type
-            text = self.extract_text(file_path)
-            
-            if not text or len(text.strip()) < 50:
-                # Try to get more debug info
-                print(f"Debug: Extracted text length: {len(text) if text else 0}")
-                if text:
-                    print(f"Debug: First 100 chars: {text[:100]}")
-                return {"error": "The document appears to be empty or too short. Please ensure it's a text-based PDF/DOCX (not scanned).", "success": False}
-            
-            # Preprocess text
-            cleaned_text = self.preprocess_text(text)
-            
-            # Extract information
-            parsed_data = {
-                'name': self.extract_name(cleaned_text),
-                'contact_info': self.extract_contact_info(cleaned_text),
-                'skills': self.extract_skills(cleaned_text),
-                'education': self.extract_education(cleaned_text),
-                'experience': self.extract_experience(cleaned_text),
-                'text_length': len(cleaned_text),
-                'raw_text': cleaned_text[:1000] + "..." if len(cleaned_text) > 1000 else cleaned_text,
-                'success': True
-            }
-            
-            return parsed_data
-            
+            # Read a stream once here so the cache and extractor share it
+            file_path = as_source(file_path)
+            digest = key = result = None
+            if self.cache is not None or self.text_cache is not None:
+                with recorder.stage('cache_lookup'):
+                    digest = self.file_digest(file_path)
+                    if self.cache is not None:
+                        key = result_key(digest, self.parser_version, self.taxonomy.version)
+                        result = self.cache.get(key)
+                        if result is not None and partial:
+                            result = select_result(result, fields)
+                        elif partial:
+                            # A selection can't stand in for the full result, so it is cached apart
+                            key = result_key(digest, f"{self.parser_version}.{'+'.join(fields)}",
+                                             self.taxonomy.version)
+                            result = self.cache.get(key)
+            if result is None:
+                result = self._parse(file_path, recorder, digest, fields)
+                if key is not None and result.get('success'):
+                    self.cache.put(key, result)
         except Exception as e:
-            return {"error": f"Error parsing resume: {str(e)}", "success": False}
+            result = {"error": f"Error parsing resume: {str(e)}", "success": False}
+        finally:
+            recorder.close()
+        
+        if recorder.enabled:
+            if timings:
+                result['timings'] = recorder.summary()
+            if self.metrics is not None:
+                for stage, timing in recorder.stages.items():
+                    self.metrics.observe_stage(stage, timing)
+                self.metrics.count('documents', status='success' if result.get('success') else 'error')
+        return result
+    
+    def file_digest(self, file_path):
+        """SHA-256 of the file's bytes, shared by the result and text cache keys"""
+        return content_hash(as_source(file_path).read_bytes())
+    
+    @property
+    def parser_version(self):
+        """PARSER_VERSION qualified by the PDF profile, whose text shapes every field"""
+        return f"{PARSER_VERSION}-{self.pdf_profile}"
+    
+    @property
+    def extractor_version(self):
+        return f"{EXTRACTOR_VERSION}-{self.pdf_profile}"
+    
+    def cache_key(self, file_path):
+        """Result cache key: file content hash plus parser and taxonomy versions"""
+        return result_key(self.file_digest(file_path), self.parser_version, self.taxonomy.version)
+    
+    def extract_text_cached(self, file_path, digest=None, fields=RESULT_FIELDS):
+        """extract_text through the text cache, when one is configured
+        
+        When only header fields are requested from a PDF, page 1 alone is
+        returned if it holds all of them; such partial text is never cached.
+        """
+        source = as_source(file_path)
+        header_only = HEADER_FIELDS.issuperset(fields) and source.format == PDF
+        if self.text_cache is None:
+            if header_only:
+                return self._read_header_pages(source, fields)[0]
+            return self.extract_text(source)
+        key = text_key(digest or self.file_digest(source), self.extractor_version)
+        text = self.text_cache.get(key)
+        if text is None:
+            if header_only:
+                text, whole = self._read_header_pages(source, fields)
+            else:
+                text, whole = self.extract_text(source), True
+            if whole and text and text.strip():
+                self.text_cache.put(key, text)
+        return text
+    
+    def _read_header_pages(self, source, fields):
+        """(text, whole): page 1 if it holds every requested header field, else all pages
+        
+        Pages come from one pass over the PDF, so page 1 is decoded once and
+        each page is counted once whether or not the rest is needed.
+        """
+        texts = []
+        pages = pdf_extract.iter_page_texts(source.open(), profile=self.pdf_profile)
+        try:
+            for page in pages:
+                if self.metrics is not None:
+                    self.metrics.count('pdf_pages', strategy=page.strategy)
+                texts.append(page.text)
+                if len(texts) == 1 and self._has_header_fields(page.text, fields):
+                    return pdf_extract.join_pages(texts), False
+        finally:
+            pages.close()
+        return pdf_extract.join_pages(texts), True
+    
+    def _has_header_fields(self, text, fields):
+        """Whether `text` alone yields the requested header fields, without NER or counters"""
+        if len(text.strip()) < 50:
+            return False
+        if 'name' in fields and names.header_name(text)[1] < names.CONFIDENT:
+            return False
+        if 'contact_info' in fields:
+            return len(contacts.scan(self.preprocess_text(text))) == len(contacts.FIELDS)
+        return True
+    
+    def _parse(self, file_path, recorder, digest=None, fields=RESULT_FIELDS):
+        # Extract text based on file type
+        with recorder.stage('extract_text'):
+            text = self.extract_text_cached(file_path, digest, fields)
+        
+        if not text or len(text.strip()) < 50:
+            # Try to get more debug info
+            print(f"Debug: Extracted text length: {len(text) if text else 0}")
+            if text:
+                print(f"Debug: First 100 chars: {text[:100]}")
+            return {"error": "The document appears to be empty or too short. Please ensure it's a text-based PDF/DOCX (not scanned).", "success": False}
+        
+        return self._extract_fields(text, recorder, fields)
+    
+    def _extract_fields(self, text, recorder, fields):
+        # Preprocess text
+        with recorder.stage('preprocess'):
+            cleaned_text = self.preprocess_text(text)
+        
+        # Extract the requested fields; NER runs at most once, is shared by
+        # name and experience, and is skipped when no requested field needs it
+        context = self.analyze(cleaned_text, raw_text=text, stages=required_stages(fields))
+        parsed_data = {}
+        if 'name' in fields:
+            with recorder.stage('name'):
+                parsed_data['name'] = self.extract_name(context)
+        if 'contact_info' in fields:
+            with recorder.stage('contact'):
+                parsed_data['contact_info'] = self.extract_contact_info(context)
+        if 'skills' in fields:
+            with recorder.stage('skills'):
+                parsed_data['skills'] = self.extract_skills(context)
+        if 'education' in fields:
+            with recorder.stage('education'):
+                parsed_data['education'] = self.extract_education(context)
+        if 'experience' in fields:
+            with recorder.stage('experience'):
+                parsed_data['experience'] = self.extract_experience(context)
+        if 'text_length' in fields:
+            parsed_data['text_length'] = len(cleaned_text)
+        if 'raw_text' in fields:
+            parsed_data['raw_text'] = cleaned_text[:1000] + "..." if len(cleaned_text) > 1000 else cleaned_text
+        parsed_data['success'] = True
+        
+        return parsed_data
+    
+    def _worker_config(self):
+        """Everything a pool worker needs to build an equivalent parser"""
+        snapshot = self.taxonomy.current()
+        config = {'offline': self.registry.offline, 'model_name': self.model_name,
+                  'timings': self.timings, 'track_memory': self.track_memory,
+                  'pdf_profile': self.pdf_profile}
+        if self.metrics is not None:
+            # Workers buffer their metrics and send them back with each result
+            config['buffer_metrics'] = True
+        if self.cache is not None:
+            config['cache_path'] = self.cache.path
+        if self.text_cache is not None:
+            config['text_cache_path'] = self.text_cache.path
+        if self.taxonomy.path is not None:
+            config['skills_path'] = self.taxonomy.path
+        else:
+            config['skills'] = (snapshot.skills_db, snapshot.aliases)
+        return config
+    
+    def parse_many(self, paths, workers=None, chunksize=1, timed=False, fields=None):
+        """Parse many resumes in a process pool, yielding (path, result) as each finishes.
+        
+        Each worker builds its own parser and loads the spaCy model once, in
+        the pool initializer. A file that fails yields the same
+        {"error": ..., "success": False} dict parse_resume returns. With
+        `timed`, tuples are (path, result, seconds spent parsing that file).
+        `fields` is passed on to parse_resume for every file. Stage timings
+        and counters recorded in the workers are merged into this parser's
+        metrics sink as their results arrive.
+        """
+        if fields is not None:
+            # Fail here, not once per file inside the workers
+            fields = check_fields(fields)
+        paths = (os.fspath(path) for path in paths)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for path in paths:
+                item = _parse_timed(self, path, fields)
+                yield item if timed else item[:2]
+            return
+        
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(self._worker_config(),)) as pool:
+            parse = functools.partial(_parse_in_worker, fields=fields)
+            for *item, events in pool.imap_unordered(parse, paths, chunksize):
+                if self.metrics is not None:
+                    replay(events, self.metrics)
+                yield tuple(item) if timed else tuple(item[:2])
+
+# Parser owned by each parse_many worker process
+_worker_parser = None
+
+def _init_worker(config):
+    global _worker_parser
+    config = dict(config)
+    skills = config.pop('skills', None)
+    cache_path = config.pop('cache_path', None)
+    if cache_path is not None:
+        config['cache'] = ResultCache(cache_path)
+    text_cache_path = config.pop('text_cache_path', None)
+    if text_cache_path is not None:
+        config['text_cache'] = TextCache(text_cache_path)
+    if config.pop('buffer_metrics', False):
+        config['metrics'] = MetricsBuffer()
+    _worker_parser = ResumeParser(**config)
+    if skills is not None:
+        _worker_parser.taxonomy = SkillTaxonomy.from_dict(*skills)
+    try:
+        # Warm the model here so the first file doesn't pay for loading it
+        _worker_parser.nlp
+    except Exception as e:
+        # Raising would make the pool respawn the worker forever; the error
+        # resurfaces per file through parse_resume instead
+        print(f"Worker model warm-up failed: {e}")
+
+def _parse_timed(parser, path, fields=None):
+    start = time.perf_counter()
+    result = parser.parse_resume(path, fields=fields)
+    return path, result, time.perf_counter() - start
+
+def _parse_in_worker(path, fields=None):
+    item = _parse_timed(_worker_parser, path, fields)
+    metrics = _worker_parser.metrics
+    return item + (metrics.drain() if metrics is not None else [],)
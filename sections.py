@@ -0,0 +1,105 @@
+import re
+
+# Section name -> headings that open it, compared after normalize_heading()
+SECTION_HEADINGS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+        'objective', 'career objective', 'about me', 'about',
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history',
+        'professional background', 'internships', 'internship experience',
+    ],
+    'education': [
+        'education', 'academic background', 'academics', 'qualifications',
+        'academic qualifications', 'educational qualifications', 'education and training',
+        'educational background',
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'core competencies',
+        'competencies', 'technologies', 'tech stack', 'tools and technologies',
+        'skills and tools', 'technical proficiencies', 'areas of expertise',
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects', 'selected projects',
+    ],
+    'certifications': [
+        'certifications', 'certificates', 'licenses and certifications', 'courses',
+    ],
+    # Not read by any extractor, but they end the section before them
+    'other': [
+        'awards', 'honors', 'achievements', 'publications', 'languages', 'interests',
+        'hobbies', 'references', 'volunteering', 'volunteer experience', 'activities',
+    ],
+}
+
+HEADING_LOOKUP = {heading: section
+                  for section, headings in SECTION_HEADINGS.items()
+                  for heading in headings}
+
+# Headings are short; anything longer is content and skips the lookup
+MAX_HEADING_CHARS = 50
+
+_EDGE_RE = re.compile(r'^[\W\d_]+|[\W_]+$')
+_SPACED_RE = re.compile(r'^(?:\w ){2,}\w$')
+
+
+def normalize_heading(line):
+    """Lowercase a candidate heading and strip bullets, numbering and colons"""
+    line = _EDGE_RE.sub('', line.strip())
+    # Letter-spaced headings such as "E D U C A T I O N"
+    if _SPACED_RE.match(line):
+        line = line.replace(' ', '')
+    return ' '.join(line.replace('&', ' and ').lower().split())
+
+
+def heading_section(line):
+    """(section, inline content) if `line` is a heading, else None.
+
+    "Skills: Python, Go" is a heading with inline content "Python, Go".
+    """
+    stripped = line.strip()
+    if not stripped or len(stripped) > 200:
+        return None
+    if len(stripped) <= MAX_HEADING_CHARS:
+        section = HEADING_LOOKUP.get(normalize_heading(stripped))
+        if section:
+            return section, ""
+    head, colon, rest = stripped.partition(':')
+    if colon and len(head) <= MAX_HEADING_CHARS:
+        section = HEADING_LOOKUP.get(normalize_heading(head))
+        if section:
+            return section, rest.strip()
+    return None
+
+
+def segment(text):
+    """Split raw resume text into sections using its line structure.
+
+    Returns {section: text}. Lines before the first heading are under
+    'header'; a section heading that repeats appends to the same entry.
+    Text without any recognised heading yields {}.
+    """
+    if not text:
+        return {}
+    sections = {}
+    current = 'header'
+    lines = []
+    found = False
+    for line in text.splitlines():
+        heading = heading_section(line)
+        if heading is None:
+            lines.append(line)
+            continue
+        found = True
+        if lines:
+            sections.setdefault(current, []).extend(lines)
+        current, inline = heading
+        lines = [inline] if inline else []
+    if not found:
+        return {}
+    if lines:
+        sections.setdefault(current, []).extend(lines)
+    return {name: '\n'.join(section_lines).strip() for name, section_lines in sections.items()
+            if any(line.strip() for line in section_lines)}
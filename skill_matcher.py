@@ -0,0 +1,145 @@
+from collections import deque
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill in a taxonomy.
+
+    The taxonomy is compiled once; match() then finds every skill of every
+    category, or any alias of one, in a single pass over the text. A hit
+    only counts when it sits on word boundaries, which are checked at the
+    skill's own edges only, so tokens ending in punctuation such as `c++`,
+    `c#` or `ci/cd` still match.
+    """
+
+    def __init__(self, skills_db, aliases=None):
+        self.categories = list(skills_db.keys())
+        # (category index, skill) for every taxonomy entry, in taxonomy order
+        self.entries = []
+        # lowercased skill -> entry ids that use it (a skill can be in several categories)
+        entry_ids = {}
+        for category_index, category in enumerate(self.categories):
+            for skill in skills_db[category]:
+                key = skill.lower().strip()
+                if not key:
+                    continue
+                entry_ids.setdefault(key, []).append(len(self.entries))
+                self.entries.append((category_index, skill))
+
+        # An alias matches as its own keyword but reports the canonical skill
+        for alias, canonical in (aliases or {}).items():
+            alias, canonical = alias.lower().strip(), canonical.lower().strip()
+            if alias and canonical in entry_ids and alias not in entry_ids:
+                entry_ids[alias] = entry_ids[canonical]
+
+        self.keywords = list(entry_ids.keys())
+        self._entry_ids = [entry_ids[keyword] for keyword in self.keywords]
+        self._build()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def to_state(self):
+        """The compiled automaton as plain lists and dicts, for storing as JSON"""
+        return {'categories': self.categories, 'entries': self.entries, 'keywords': self.keywords,
+                'entry_ids': self._entry_ids, 'goto': self._goto, 'fail': self._fail,
+                'outputs': self._outputs}
+
+    @classmethod
+    def from_state(cls, state):
+        """A matcher rebuilt from to_state() output without recompiling"""
+        matcher = cls.__new__(cls)
+        matcher.categories = list(state['categories'])
+        matcher.entries = [(category_index, skill) for category_index, skill in state['entries']]
+        matcher.keywords = list(state['keywords'])
+        matcher._entry_ids = state['entry_ids']
+        matcher._goto = state['goto']
+        matcher._fail = state['fail']
+        matcher._outputs = state['outputs']
+        if not len(matcher._goto) == len(matcher._fail) == len(matcher._outputs):
+            raise ValueError("Inconsistent skill index tables")
+        return matcher
+
+    def _build(self):
+        goto = [{}]
+        outputs = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth-first pass to set failure links and inherit their outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                if outputs[fail[next_state]]:
+                    outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _on_boundary(self, text, keyword, start, end):
+        # A dot between word characters joins one token, so `js` must not
+        # match inside `node.js` nor `net` inside `asp.net`
+        if start > 0 and _is_word_char(keyword[0]):
+            before = text[start - 1]
+            if _is_word_char(before) or (before == '.' and start > 1 and _is_word_char(text[start - 2])):
+                return False
+        if end < len(text) and _is_word_char(keyword[-1]):
+            after = text[end]
+            if _is_word_char(after) or (after == '.' and end + 1 < len(text) and _is_word_char(text[end + 1])):
+                return False
+        return True
+
+    def find_keywords(self, text):
+        """Indices into self.keywords of every skill found in `text`"""
+        text = text.lower()
+        goto, fail, outputs, keywords = self._goto, self._fail, self._outputs, self.keywords
+        found = set()
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                end = position + 1
+                for index in outputs[state]:
+                    if index not in found:
+                        keyword = keywords[index]
+                        if self._on_boundary(text, keyword, end - len(keyword), end):
+                            found.add(index)
+        return found
+
+    def match(self, text):
+        """Skills found in `text`, grouped by category in taxonomy order"""
+        if not text:
+            return {}
+        # Aliases share entry ids with their canonical skill, so dedupe
+        matched = set()
+        for index in self.find_keywords(text):
+            matched.update(self._entry_ids[index])
+
+        skills_found = {}
+        for entry_id in sorted(matched):
+            category_index, skill = self.entries[entry_id]
+            skills_found.setdefault(self.categories[category_index], []).append(skill)
+        return skills_found
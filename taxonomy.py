@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import skill_matcher
+from skill_matcher import SkillMatcher
+
+DEFAULT_SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.json")
+
+
+# Part of every on-disk index name: a digest of SkillMatcher's source, so
+# any change to how it compiles or matches rebuilds the cached indexes
+with open(skill_matcher.__file__, 'rb') as _source:
+    INDEX_FORMAT = hashlib.sha256(_source.read()).hexdigest()[:12]
+
+
+def default_cache_dir():
+    """Directory for on-disk caches, overridable with RESUME_PARSER_CACHE_DIR"""
+    return os.environ.get("RESUME_PARSER_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "resume_parser")
+
+
+def parse_taxonomy(data, path=""):
+    """Split raw taxonomy bytes into (categories, aliases).
+
+    The file is either {"categories": {...}, "aliases": {...}} or, for
+    small taxonomies, just the category -> skills mapping. YAML files need
+    PyYAML; JSON needs nothing extra.
+    """
+    if path.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required for YAML skill taxonomies: pip install pyyaml")
+        raw = yaml.safe_load(data)
+    else:
+        raw = json.loads(data)
+
+    if not isinstance(raw, dict):
+        raise ValueError("Skill taxonomy must be a mapping of categories to skills")
+    if 'categories' in raw:
+        categories, aliases = raw['categories'], raw.get('aliases') or {}
+    else:
+        categories, aliases = raw, {}
+
+    for category, skills in categories.items():
+        if not isinstance(skills, list):
+            raise ValueError(f"Skills for category '{category}' must be a list")
+    if not isinstance(aliases, dict):
+        raise ValueError("Skill aliases must be a mapping of alias to canonical skill")
+    return {str(c): [str(s) for s in skills] for c, skills in categories.items()}, \
+        {str(a): str(s) for a, s in aliases.items()}
+
+
+class TaxonomySnapshot:
+    """One loaded version of the taxonomy; never mutated after creation"""
+
+    def __init__(self, skills_db, aliases, matcher, version):
+        self.skills_db = skills_db
+        self.aliases = aliases
+        self.matcher = matcher
+        self.version = version
+
+
+class SkillTaxonomy:
+    """Skill taxonomy loaded from a JSON/YAML file and hot-reloaded on change.
+
+    The compiled SkillMatcher is cached on disk as JSON, keyed by the
+    file's SHA-256 and the matcher's source, so restarts and reloads of a known file skip compilation.
+    current() re-checks the file at most every `check_interval` seconds and
+    swaps in a new snapshot in one assignment; readers holding the old
+    snapshot keep using it undisturbed.
+    """
+
+    def __init__(self, path=DEFAULT_SKILLS_PATH, cache_dir=None, check_interval=2.0):
+        self.path = path
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._stat = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        if path is not None:
+            self.reload(force=True)
+
+    @classmethod
+    def from_dict(cls, skills_db, aliases=None):
+        """A fixed in-memory taxonomy that never reloads"""
+        taxonomy = cls(path=None)
+        data = json.dumps({'categories': skills_db, 'aliases': aliases or {}}, sort_keys=True)
+        version = hashlib.sha256(data.encode('utf-8')).hexdigest()[:12]
+        taxonomy._snapshot = TaxonomySnapshot(skills_db, aliases or {},
+                                              SkillMatcher(skills_db, aliases), version)
+        return taxonomy
+
+    @property
+    def version(self):
+        return self.current().version
+
+    def current(self):
+        """The latest snapshot, reloading first if the file has changed"""
+        if self.path is not None and time.monotonic() - self._last_check >= self.check_interval:
+            self._last_check = time.monotonic()
+            if self._file_stat() != self._stat:
+                try:
+                    self.reload()
+                except Exception as e:
+                    # Keep serving the previous taxonomy, e.g. while the file is half-written
+                    print(f"Skill taxonomy reload failed, keeping version {self._snapshot.version}: {e}")
+        return self._snapshot
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self, force=False):
+        """Re-read the file and swap in a new snapshot if its content changed"""
+        with self._lock:
+            stat = self._file_stat()
+            self._stat = stat
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            version = digest[:12]
+            if not force and self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            skills_db, aliases = parse_taxonomy(data, self.path)
+            matcher = self._load_index(digest)
+            if matcher is None:
+                matcher = SkillMatcher(skills_db, aliases)
+                self._save_index(digest, matcher)
+            self._snapshot = TaxonomySnapshot(skills_db, aliases, matcher, version)
+            return self._snapshot
+
+    def _index_path(self, digest):
+        return os.path.join(self.cache_dir, f"skills-{digest[:16]}-{INDEX_FORMAT}.json")
+
+    def _load_index(self, digest):
+        if not self.cache_dir:
+            return None
+        try:
+            # Plain JSON tables, so a file planted in the cache dir can't run code
+            with open(self._index_path(digest), 'r', encoding='utf-8') as f:
+                return SkillMatcher.from_state(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable skill index: {e}")
+            return None
+
+    def _save_index(self, digest, matcher):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp file then rename so readers never see a partial index
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(matcher.to_state(), f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, self._index_path(digest))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Could not write skill index cache: {e}")
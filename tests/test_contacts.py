@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+import contacts
+import normalizer
+
+
+def phone(text):
+    return contacts.scan(text).get('phone')
+
+
+@pytest.mark.parametrize('text', [
+    # A zip code or a date next to the number must not be read into it
+    normalizer.clean("Austin, TX 78701 • 555-123-4567"),
+    "Phone: 555-123-4567\n2019 - Present",
+    "Tel 555 123 4567 10001",
+    "+1 555 123 4567 90210",
+    "555 123 4567 2019",
+])
+def test_neighbouring_numbers_are_not_swallowed(text):
+    assert phone(text) == '+15551234567'
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("(555) 123-4567", '+15551234567'),
+    ("555.123.4567", '+15551234567'),
+    ("1-555-123-4567", '+15551234567'),
+    ("Call 5551234567 now", '+15551234567'),
+    ("+44 20 7946 0958", '+442079460958'),
+    ("0044 20 7946 0958", '+442079460958'),
+    ("44 20 7946 0958", '+442079460958'),
+    ("+91 98765 43210", '+919876543210'),
+    # Short groups are fine after an explicit country code
+    ("+33 1 23 45 67 89", '+33123456789'),
+])
+def test_phone_formats(text, expected):
+    assert phone(text) == expected
+
+
+@pytest.mark.parametrize('text', ["020 7946 0958", "Jan 2019 - Present", "ID 12345678",
+                                  # Ten digits, but not grouped like a national number
+                                  "Employee 12345 67890"])
+def test_not_phones(text):
+    assert phone(text) is None
+
+
+def test_nanp_numbers_have_eleven_digits():
+    assert contacts.normalize_phone("+1 555 123 4567 123") is None
+
+
+def test_scan_normalizes_every_field():
+    found = contacts.scan("jane@Example.COM | linkedin.com/in/JaneSmith | (555) 123-4567")
+    assert found == {'email': 'jane@example.com',
+                     'linkedin': 'https://www.linkedin.com/in/janesmith',
+                     'phone': '+15551234567'}
+
+
+def test_email_scan_is_linear_without_an_at_sign():
+    # A pattern starting with the local part rescans the run from every
+    # position; 40 KB of this took 18 s
+    text = "1-" * 500_000
+    start = time.perf_counter()
+    assert contacts.scan(text) == {}
+    assert time.perf_counter() - start < 2.0
+
+
+def test_email_is_found_from_its_at_sign():
+    assert contacts.find_email("Email: .jane.doe@Example.co.uk, 555") == "jane.doe@Example.co.uk"
+    assert contacts.find_email("no address @ here") is None
@@ -0,0 +1,72 @@
+import time
+
+from experience import BARE, EXPLICIT, LEAD_IN, best_years, find_years
+
+# Flattened one-line text full of "experience" and digits but no "N years":
+# a backtracking pattern rescans to the end of the text from every occurrence
+ADVERSARIAL_UNIT = "experience with 3 teams across 12 projects and 2 products; "
+
+# Seconds allowed for 1 MB, generous enough for a slow CI machine; the
+# quadratic patterns this replaced took minutes
+MAX_SECONDS_PER_MB = 2.0
+
+
+def _adversarial(size):
+    return (ADVERSARIAL_UNIT * (size // len(ADVERSARIAL_UNIT) + 1))[:size]
+
+
+def test_one_megabyte_scans_in_linear_time():
+    text = _adversarial(1_000_000)
+    start = time.perf_counter()
+    mentions = find_years(text)
+    elapsed = time.perf_counter() - start
+    assert mentions == []
+    assert elapsed < MAX_SECONDS_PER_MB
+
+
+def test_long_whitespace_run_scans_in_linear_time():
+    # Two optional whitespace runs around '+' could split one long run
+    # every possible way; 20 000 spaces took seconds
+    text = "5" + " " * 200_000
+    start = time.perf_counter()
+    mentions = find_years(text)
+    elapsed = time.perf_counter() - start
+    assert mentions == []
+    assert elapsed < MAX_SECONDS_PER_MB
+
+
+def test_explicit_experience_beats_earlier_bare_duration():
+    text = "Led a 2 years migration. Python developer with 5+ years of experience."
+    best = best_years(find_years(text))
+    assert best.years == '5'
+    assert best.plus
+    assert best.score == EXPLICIT
+
+
+def test_lead_in_phrase_is_found():
+    best = best_years(find_years("Professional experience of 7 years in backend systems"))
+    assert best.years == '7'
+    assert best.score in (EXPLICIT, LEAD_IN)
+
+
+def test_bare_durations_are_candidates_but_not_best():
+    mentions = find_years("Contract role, 2 years. Internship, 1 year.")
+    assert [mention.years for mention in mentions] == ['2', '1']
+    assert all(mention.score == BARE for mention in mentions)
+    assert best_years(mentions) is None
+
+
+def test_earlier_mention_wins_a_tie():
+    best = best_years(find_years("8 years of experience in Java. 3 years of experience in Go."))
+    assert best.years == '8'
+
+
+def test_implausible_figures_are_ignored():
+    assert find_years("Born 1990, 60 years of experience in nothing") == []
+
+
+def test_offsets_point_at_the_phrase():
+    text = "Summary: 10 yrs experience building APIs"
+    mention = find_years(text)[0]
+    assert text[mention.start:mention.end] == mention.text
+    assert mention.years == '10'
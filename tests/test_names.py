@@ -0,0 +1,47 @@
+import pytest
+
+import names
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Jane Smith\nSoftware Engineer\njane@example.com", "Jane Smith"),
+    ("JOHN SMITH\n555-123-4567 | john@example.com", "John Smith"),
+    ("Resume\nMaria de la Cruz\nData Analyst", "Maria de la Cruz"),
+    ("Personal Details\nJane Smith\njane@example.com", "Jane Smith"),
+])
+def test_confident_header_names(text, expected):
+    name, confidence = names.header_name(text)
+    assert name == expected
+    assert confidence >= names.CONFIDENT
+
+
+@pytest.mark.parametrize('line', ["Personal Details", "Career Highlights", "Acme Corporation Ltd",
+                                  "State University", "Professional Experience"])
+def test_headings_and_organisations_are_not_names(line):
+    assert names.score_line(line, 0) == (None, 0.0)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Jimmy Page\nGuitarist", "Jimmy Page"),
+    ("Jane Street\njane@example.com", "Jane Street"),
+    ("Francis Scott Key\nLawyer", "Francis Scott Key"),
+])
+def test_surnames_that_open_headings(text, expected):
+    name, confidence = names.header_name(text)
+    assert name == expected
+    assert confidence >= names.CONFIDENT
+
+
+@pytest.mark.parametrize('line', ["Key Contacts", "Lead Architect", "Page Two", "Street Address"])
+def test_those_words_still_open_headings(line):
+    assert names.score_line(line, 0) == (None, 0.0)
+
+
+def test_several_name_shaped_lines_leave_it_to_ner():
+    name, confidence = names.header_name("Jane Smith\nSan Francisco\njane@example.com")
+    assert name == "Jane Smith"
+    assert confidence < names.CONFIDENT
+
+
+def test_no_name():
+    assert names.header_name("jane@example.com\n555-123-4567") == ("Not found", 0.0)
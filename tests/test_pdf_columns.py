@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip('pdfplumber')
+
+import pdf_extract
+
+
+class WordsPage:
+    """Just enough of a pdfplumber page for words_text: its width and words"""
+
+    width = 612
+
+    def __init__(self, words):
+        self.words = words
+
+    def extract_words(self, **tolerances):
+        return [dict(word) for word in self.words]
+
+
+def _words(text, x0, baseline, size):
+    """Words of `text` set from x0 on `baseline` in a font of `size` points"""
+    words = []
+    for token in text.split():
+        x1 = x0 + len(token) * size * 0.5
+        words.append({'text': token, 'x0': x0, 'x1': x1,
+                      'top': baseline - size * 0.72, 'bottom': baseline + size * 0.21})
+        x0 = x1 + size * 0.3
+    return words
+
+
+def _page(rows, left_size=10, right_size=10, right_x=220):
+    words = []
+    for number, (left, right) in enumerate(rows):
+        baseline = 100 + number * 14
+        if left:
+            words += _words(left, 40, baseline, left_size)
+        if right:
+            words += _words(right, right_x, baseline, right_size)
+    return WordsPage(words)
+
+
+def test_sidebar_is_read_column_by_column():
+    # A 9 pt sidebar beside 10.5 pt main text, sharing the line grid
+    page = _page([("SKILLS", "EXPERIENCE"),
+                  ("Python", "Senior Engineer at Acme"),
+                  ("Go", "Built the billing platform in Python"),
+                  ("Docker", "Led a team of five engineers"),
+                  ("", "2019 - 2021"),
+                  ("EDUCATION", "Engineer at Foo"),
+                  ("BSc Computer Science", "Migrated services to Kubernetes")],
+                 left_size=9, right_size=10.5)
+    text, two_columns = pdf_extract.words_text(page)
+    assert two_columns
+    assert text.splitlines() == [
+        "SKILLS", "Python", "Go", "Docker", "EDUCATION", "BSc Computer Science",
+        "EXPERIENCE", "Senior Engineer at Acme", "Built the billing platform in Python",
+        "Led a team of five engineers", "2019 - 2021", "Engineer at Foo",
+        "Migrated services to Kubernetes",
+    ]
+
+
+def test_key_value_table_stays_row_by_row():
+    page = _page([("Languages", "Python, Java, C++, Rust,"),
+                  ("", "Go, TypeScript"),
+                  ("Frameworks", "Django, React"),
+                  ("Cloud Platforms", "AWS, GCP"),
+                  ("Tools", "Docker, Git")])
+    text, two_columns = pdf_extract.words_text(page)
+    assert not two_columns
+    assert text.splitlines() == [
+        "Languages Python, Java, C++, Rust,", "Go, TypeScript", "Frameworks Django, React",
+        "Cloud Platforms AWS, GCP", "Tools Docker, Git",
+    ]
+
+
+def test_single_column_page_is_untouched():
+    page = _page([("Jane Doe", ""), ("Senior engineer building data platforms at Acme", "")])
+    assert pdf_extract.words_text(page) == ("Jane Doe\nSenior engineer building data platforms at Acme", False)
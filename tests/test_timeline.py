@@ -0,0 +1,48 @@
+import datetime
+import re
+import time
+
+from timeline import MAX_LABEL_CHARS, build_timeline, find_roles
+
+TODAY = datetime.date(2024, 6, 1)
+
+RESUME = """Senior Engineer, Acme Corp
+Jan 2019 - Present
+Engineer | Beta Inc | 03/2016 to 05/2019
+Intern, Gamma 2015 - 2016
+"""
+
+
+def test_roles_are_labelled_by_their_own_line():
+    titles = [role['title'] for role in build_timeline(RESUME, TODAY)['roles']]
+    assert titles == ['Senior Engineer, Acme Corp', 'Engineer | Beta Inc', 'Intern, Gamma']
+
+
+def test_overlapping_roles_count_once():
+    timeline = build_timeline(RESUME, TODAY)
+    # All of 2015, then Mar 2016 through Jun 2024 with the 2019 overlap merged
+    assert timeline['total_months'] == 12 + 100
+    assert timeline['spans'] == [{'start': '2015-01', 'end': '2015-12'},
+                                 {'start': '2016-03', 'end': '2024-06'}]
+
+
+def test_excluded_labels_are_skipped():
+    text = "B.Sc. Computer Science\n2011 - 2015\nDeveloper, Acme\n2016 - 2018\n"
+    roles = find_roles(text, TODAY, exclude=re.compile(r'b\.sc', re.IGNORECASE))
+    assert [role.title for role in roles] == ['Developer, Acme']
+
+
+def test_labels_are_bounded_on_text_without_line_breaks():
+    text = "x" * 500 + " Engineer Jan 2019 - Present " + "y" * 500
+    (role,) = find_roles(text, TODAY)
+    assert len(role.title) <= MAX_LABEL_CHARS
+    assert 'Engineer' in role.title
+
+
+def test_one_line_text_is_linear():
+    # Labels used to be cut from the whole line for every range: quadratic
+    text = "Jan 2019 - " * (200_000 // len("Jan 2019 - "))
+    start = time.perf_counter()
+    roles = find_roles(text, TODAY)
+    assert roles
+    assert time.perf_counter() - start < 2.0
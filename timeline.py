@@ -0,0 +1,159 @@
+import datetime
+import re
+from collections import namedtuple
+
+MONTHS = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+          'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+
+_MONTH = (r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+          r'|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?')
+_YEAR = r'(?:19[5-9]\d|20\d\d)'
+
+
+def _date(prefix):
+    return (rf'(?:(?P<{prefix}_month>{_MONTH})\s*,?\s*(?P<{prefix}_year>{_YEAR})'
+            rf'|(?P<{prefix}_num>0?[1-9]|1[0-2])\s*[/.]\s*(?P<{prefix}_nyear>{_YEAR})'
+            rf'|(?P<{prefix}_iso>{_YEAR})[-/](?P<{prefix}_isomonth>0[1-9]|1[0-2])\b'
+            rf'|(?P<{prefix}_only>{_YEAR}))')
+
+
+# "Jan 2018 - Present", "03/2016 to 05/2019", "2019-04 – 2021-10", "2015 - 2018".
+# Alternation without nested repetition, so matching is linear in the text.
+RANGE_RE = re.compile(
+    rf'\b{_date("start")}\s*(?:-|–|—|to|until|till|through)\s*'
+    rf'(?:(?P<present>present|current|now|today|date|ongoing)|{_date("end")})\b',
+    re.IGNORECASE)
+
+# Every range contains a year, and a bare year is far cheaper to find than
+# the full grammar; RANGE_RE only runs in a window around each year found.
+# The window reaches back over the longest start month ("September, ")
+# and forward over a separator and the longest end date.
+YEAR_RE = re.compile(_YEAR)
+START_LOOKBACK = 16
+END_LOOKAHEAD = 48
+
+_LABEL_STRIP = ' \t|,;:()[]-–—•*'
+MAX_LABEL_CHARS = 100
+# How far back a range on a line of its own looks for the line naming it
+MAX_LABEL_LOOKBACK = 4 * MAX_LABEL_CHARS
+
+Role = namedtuple('Role', ['title', 'start', 'end', 'months', 'current', 'offset'])
+
+
+def _month_index(match, prefix):
+    """(year * 12 + month - 1, whether only the year was given) for one side of a range"""
+    group = match.group
+    if group(f'{prefix}_month'):
+        return int(group(f'{prefix}_year')) * 12 + MONTHS[group(f'{prefix}_month')[:3].lower()] - 1, False
+    if group(f'{prefix}_num'):
+        return int(group(f'{prefix}_nyear')) * 12 + int(group(f'{prefix}_num')) - 1, False
+    if group(f'{prefix}_iso'):
+        return int(group(f'{prefix}_iso')) * 12 + int(group(f'{prefix}_isomonth')) - 1, False
+    return int(group(f'{prefix}_only')) * 12, True
+
+
+def _label(text, start, end):
+    """What a date range belongs to: the rest of its line, else the nearest line above.
+
+    Only MAX_LABEL_CHARS either side of the range are looked at, so a text
+    without line breaks costs the same per range as one with them.
+    """
+    window_start = max(0, start - MAX_LABEL_CHARS)
+    line_start = text.rfind('\n', window_start, start) + 1 or window_start
+    line_end = text.find('\n', end, end + MAX_LABEL_CHARS)
+    if line_end == -1:
+        line_end = min(len(text), end + MAX_LABEL_CHARS)
+    label = f"{text[line_start:start]} {text[end:line_end]}".strip(_LABEL_STRIP)
+    lookback = max(0, start - MAX_LABEL_LOOKBACK)
+    while not label and line_start > lookback and text[line_start - 1] == '\n':
+        line_end = line_start - 1
+        window_start = max(lookback, line_end - MAX_LABEL_CHARS)
+        line_start = text.rfind('\n', window_start, line_end) + 1 or window_start
+        label = text[line_start:line_end].strip(_LABEL_STRIP)
+    return ' '.join(label.split())[:MAX_LABEL_CHARS]
+
+
+def format_month(index):
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def iter_ranges(text):
+    """RANGE_RE matches in `text`, searching only around the years in it"""
+    pos = 0
+    for year in YEAR_RE.finditer(text):
+        if year.start() < pos:
+            continue
+        window_end = year.end() + END_LOOKAHEAD
+        match = RANGE_RE.search(text, max(pos, year.start() - START_LOOKBACK), window_end)
+        if match is None:
+            continue
+        if match.end() >= window_end:
+            # The window may have cut the end date short; match again without it
+            match = RANGE_RE.match(text, match.start())
+            if match is None:
+                continue
+        yield match
+        pos = match.end()
+
+
+def find_roles(text, today=None, exclude=None):
+    """Every date range in `text` as a Role, in order of appearance.
+
+    `start` and `end` are month indices (year * 12 + month - 1) with `end`
+    exclusive. A year-only start means January; a year-only end means the
+    start of that year ("2015 - 2018" is three years), or its end when the
+    range starts and ends in the same year. Present-day ends use `today`.
+    Ranges whose label matches the `exclude` regex (a degree, say) are skipped.
+    """
+    today = today or datetime.date.today()
+    now = today.year * 12 + today.month
+    roles = []
+    for match in iter_ranges(text):
+        start, _ = _month_index(match, 'start')
+        current = bool(match.group('present'))
+        if current:
+            end = now
+        else:
+            end, year_only = _month_index(match, 'end')
+            if not year_only:
+                end += 1
+            elif end <= start:
+                end += 12
+        if end <= start or start >= now:
+            continue
+        label = _label(text, match.start(), match.end())
+        if exclude is not None and exclude.search(label):
+            continue
+        roles.append(Role(label, start, end, end - start, current, match.start()))
+    return roles
+
+
+def merge_intervals(intervals):
+    """Merge overlapping or touching [start, end) intervals with one sort and one sweep"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def build_timeline(text, today=None, exclude=None):
+    """Job timeline of a resume: per-role tenure and total experience.
+
+    Overlapping roles (two part-time jobs, a promotion listed under both
+    titles) are counted once in the total. `exclude` is passed to find_roles.
+    """
+    roles = find_roles(text, today, exclude)
+    spans = merge_intervals((role.start, role.end) for role in roles)
+    total = sum(end - start for start, end in spans)
+    return {
+        'total_months': total,
+        'total_years': round(total / 12, 1),
+        'roles': [{'title': role.title, 'start': format_month(role.start),
+                   'end': 'present' if role.current else format_month(role.end - 1),
+                   'months': role.months, 'offset': role.offset} for role in roles],
+        'spans': [{'start': format_month(start), 'end': format_month(end - 1)} for start, end in spans],
+    }